@@ -10,7 +10,7 @@ import re
 import json
 import logging
 from app.models.schemas import Manuscript, Issue, PICO
-from app.services.llm_client import get_llm_client
+from app.services.llm_client import LLMClient, get_llm_client
 from app.services.prompt_templates import get_prompt
 
 logger = logging.getLogger("agents.pico_parser_enhanced")
@@ -163,7 +163,7 @@ class EnhancedPICOParser:
         # Parse LLM response
         try:
             logger.debug("🔍 [Enhanced-PICO-Parser] Parsing LLM JSON response...")
-            pico_data = json.loads(response)
+            pico_data = LLMClient.parse_json(response)
             
             # Validate required structure
             required_keys = ["population", "intervention", "comparator", "outcomes"]
@@ -271,7 +271,7 @@ class EnhancedPICOParser:
             
             # Parse response and create issues
             logger.debug("🔍 [Enhanced-PICO-Parser] Parsing LLM quality assessment response...")
-            quality_assessment = json.loads(response)
+            quality_assessment = LLMClient.parse_json(response)
             
             quality_score = quality_assessment.get("quality_score", 100)
             clinical_relevance = quality_assessment.get("clinical_relevance", "medium")
@@ -8,7 +8,7 @@ for improved compliance assessment and recommendations.
 from typing import List, Dict, Optional
 import logging
 from app.models.schemas import Manuscript, Issue, SearchDescriptor, FlowCounts, StudyRecord
-from app.services.llm_client import get_llm_client
+from app.services.llm_client import LLMClient, get_llm_client
 from app.services.prompt_templates import get_prompt
 
 logger = logging.getLogger("agents.prisma_checker")
@@ -344,8 +344,7 @@ class EnhancedPRISMAChecker:
         issues = []
 
         try:
-            import json
-            assessment = json.loads(response)
+            assessment = LLMClient.parse_json(response)
 
             # Process overall compliance score
             compliance_score = assessment.get("compliance_score", 100)
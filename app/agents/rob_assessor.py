@@ -9,7 +9,7 @@ from typing import List, Dict, Optional, Any
 import json
 import logging
 from app.models.schemas import Manuscript, StudyRecord, Issue
-from app.services.llm_client import get_llm_client
+from app.services.llm_client import LLMClient, get_llm_client
 from app.services.prompt_templates import get_prompt
 
 logger = logging.getLogger("agents.rob_assessor")
@@ -285,7 +285,7 @@ class RoBAssessor:
         """Parse LLM response into structured risk of bias assessment."""
         try:
             # Try to parse JSON response
-            assessment = json.loads(response)
+            assessment = LLMClient.parse_json(response)
             return assessment
         except json.JSONDecodeError:
             # Fallback parsing if JSON is malformed
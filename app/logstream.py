@@ -1,4 +1,6 @@
+import asyncio
 import logging
+import logging.handlers
 import threading
 import queue
 from typing import Callable, Set, Tuple
@@ -25,17 +27,42 @@ class BroadcastHandler(logging.Handler):
                 pass
 
 
+class _RecordQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that enqueues records as-is.
+
+    The stock prepare() formats the record on the emitting thread so it can
+    be pickled; this queue never leaves the process, so formatting is
+    deferred to the listener thread along with the fan-out.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
 _broadcast_handler = BroadcastHandler()
 _broadcast_handler.setLevel(logging.INFO)
 _broadcast_handler.setFormatter(
     logging.Formatter("%(asctime)s | %(levelname)s | %(name)s | %(message)s")
 )
 
+# One process-wide record queue decouples request/agent threads from SSE
+# fan-out: emit() is a lock-free put, and a single QueueListener thread does
+# the formatting and listener callbacks, so concurrent reviews never
+# serialize their logging through the broadcast handler.
+_record_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_queue_handler = _RecordQueueHandler(_record_queue)
+_queue_handler.setLevel(logging.INFO)
+_queue_listener = logging.handlers.QueueListener(
+    _record_queue, _broadcast_handler, respect_handler_level=True
+)
+
 
 def ensure_handler_installed() -> None:
     root = logging.getLogger()
-    if not any(isinstance(h, BroadcastHandler) for h in root.handlers):
-        root.addHandler(_broadcast_handler)
+    if not any(isinstance(h, _RecordQueueHandler) for h in root.handlers):
+        root.addHandler(_queue_handler)
+    if _queue_listener._thread is None:
+        _queue_listener.start()
 
 
 def register_listener():
@@ -50,6 +77,24 @@ def register_listener():
     return q, _cb
 
 
+def register_async_listener(loop: asyncio.AbstractEventLoop = None):
+    """Register a listener backed by an asyncio.Queue for SSE consumers.
+
+    Log records are emitted from worker threads, so each line hops onto the
+    event loop via call_soon_threadsafe; the consumer then awaits
+    ``queue.get()`` instead of polling ``Queue.empty()``.
+    """
+    loop = loop or asyncio.get_running_loop()
+    q: "asyncio.Queue[str]" = asyncio.Queue()
+
+    def _cb(line: str):
+        loop.call_soon_threadsafe(q.put_nowait, line)
+
+    with _lock:
+        _listeners.add(_cb)
+    return q, _cb
+
+
 def unregister_listener(cb: Callable[[str], None]):
     with _lock:
         _listeners.discard(cb)
@@ -1,29 +1,73 @@
-from fastapi import FastAPI, UploadFile, File, HTTPException
-from fastapi.responses import JSONResponse, StreamingResponse, FileResponse
+from fastapi import BackgroundTasks, FastAPI, Request, UploadFile, File, HTTPException
+from fastapi.responses import JSONResponse, StreamingResponse, FileResponse, ORJSONResponse
+try:
+    from sse_starlette.sse import EventSourceResponse
+except ImportError:  # pragma: no cover - fall back to plain StreamingResponse
+    EventSourceResponse = None
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from pathlib import Path
-import tempfile
-import shutil
-import json
+import asyncio
+import orjson
 import time
 import logging
 import uuid
 import os
+import hashlib
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+import aiofiles
+import aiofiles.os
+import aiofiles.tempfile
+from functools import cache
 from app.models.schemas import Manuscript, ReviewResult, StreamingEvent
-from app.langraph_orchestrator import (
-    run_multi_agent_review,
-    run_enhanced_multi_agent_review,
-    run_multi_agent_review_streaming,
-)
 from app.logstream import (
     ensure_handler_installed,
-    register_listener,
+    register_async_listener,
     unregister_listener,
 )
-from app.utils.pdf_ingest import extract_manuscript_from_file
+from app.services.llm_config import get_llm_environment
+
+
+@cache
+def _orchestrator():
+    """Import the LangGraph orchestrator on first use.
+
+    Importing app.langraph_orchestrator pulls LangGraph, the agents and the
+    LLM client and compiles the agent graph (~0.5s). Deferring it keeps
+    `import app.main` cheap for scripts, tests and parse-only traffic; the
+    startup hook still triggers the import so serving processes compile the
+    graph at boot rather than on the first review request.
+    """
+    from app import langraph_orchestrator
+
+    return langraph_orchestrator
+
 
-app = FastAPI(title="Systematic Review Auditor — Enhanced Platform")
+@cache
+def _simple_orchestrator():
+    """Import the simple (non-LangGraph) orchestrator on first use."""
+    from app import orchestrator
+
+    return orchestrator
+
+
+@cache
+def _ingest():
+    """Import the document-extraction module (python-docx, spaCy) on first use."""
+    from app.utils import pdf_ingest
+
+    return pdf_ingest
+
+# Serialize all JSON responses with orjson instead of stdlib json; Pydantic
+# v2 compiles model validators once at class definition, so response
+# encoding is the remaining per-request serialization cost.
+app = FastAPI(
+    title="Systematic Review Auditor — Enhanced Platform",
+    default_response_class=ORJSONResponse,
+)
 
 # Add CORS middleware
 cors_origins = os.getenv("CORS_ORIGINS", "*")
@@ -42,17 +86,29 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Review results with many studies run to hundreds of KB of JSON; compress
+# anything over 1KB. Starlette skips text/event-stream by default, so the
+# SSE endpoints stay uncompressed as the spec expects.
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 @app.middleware("http")
 async def add_streaming_headers(request, call_next):
-    """Add headers to prevent connection pooling issues with streaming endpoints."""
+    """Keep reverse proxies from buffering or caching streaming responses."""
     response = await call_next(request)
-    
-    # For streaming endpoints, add additional headers
+
+    # Nginx buffers up to 8KB of a proxied response unless told not to, which
+    # turns real-time SSE into bursty multi-second batches. EventSourceResponse
+    # sets these on the SSE routes already; enforce them for any /stream path
+    # and leave its Connection: keep-alive header alone.
     if "/stream" in request.url.path:
-        response.headers["Connection"] = "close"  # Prevent connection reuse
-        response.headers["Keep-Alive"] = "timeout=0"  # Disable keep-alive
+        response.headers["X-Accel-Buffering"] = "no"
+        response.headers.setdefault("Cache-Control", "no-cache")
         response.headers["X-Connection-Type"] = "streaming"  # Debug header
-    
+        # An explicit identity encoding tells intermediaries not to compress
+        # the stream themselves - proxy-side gzip buffers whole frames.
+        if response.headers.get("content-type", "").startswith("text/event-stream"):
+            response.headers.setdefault("Content-Encoding", "identity")
+
     return response
 
 # Mount frontend static assets if present
@@ -82,54 +138,517 @@ if not logger.handlers:
 logger.setLevel(logging.INFO)
 
 
+class _RidAdapter(logging.LoggerAdapter):
+    """Prefixes the request id once so call sites stop re-formatting it."""
+
+    def process(self, msg, kwargs):
+        return f"{self.extra['rid']} | {msg}", kwargs
+
+
+@dataclass(slots=True)
+class _ReqCtx:
+    """Per-request id, start time and rid-bound logger in one allocation.
+
+    Log calls go through the adapter with %-style arguments, so message
+    interpolation is skipped entirely when the level is disabled.
+    """
+
+    rid: str
+    t0: float
+    log: logging.LoggerAdapter
+
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self.t0) * 1000
+
+
+def _req_ctx() -> _ReqCtx:
+    rid = uuid.uuid4().hex[:8]
+    return _ReqCtx(rid, time.perf_counter(), _RidAdapter(logger, {"rid": rid}))
+
+
+@app.on_event("startup")
+async def prewarm_llm_connections():
+    """Pre-warm the agent graph and HTTPS connections to LLM providers.
+
+    Compiles the LangGraph agent graph and opens a connection to each
+    provider's base URL at boot so the first review request doesn't pay
+    graph compilation or DNS lookup + TLS handshake latency.
+    Failures are logged and swallowed - a provider being down at startup
+    should never prevent the app from serving.
+    """
+    provider_base_urls = {
+        "openrouter": "https://openrouter.ai/api/v1",
+        "ollama": "http://localhost:11434",
+    }
+    try:
+        import httpx
+
+        await asyncio.to_thread(_orchestrator)
+
+        env = get_llm_environment()
+        providers = {m.provider for m in env.settings.models.values()}
+        async with httpx.AsyncClient() as client:
+            for provider in providers:
+                base_url = provider_base_urls.get(provider)
+                if not base_url:
+                    continue
+                try:
+                    await client.head(base_url, timeout=5)
+                    logger.info(f"prewarm_llm | connection primed provider={provider}")
+                except Exception as e:
+                    logger.warning(
+                        f"prewarm_llm | could not reach provider={provider} error={e}"
+                    )
+    except Exception as e:
+        logger.warning(f"prewarm_llm | skipped error={e}")
+
+
+# ---------------------------------------------------------------------------
+# Review result cache
+# ---------------------------------------------------------------------------
+# Reviews are expensive (multiple LLM calls) but deterministic enough that
+# re-submitting the same manuscript - common while authors iterate - should
+# not pay the full cost again. Results are kept in a small in-process LRU
+# keyed by a content hash of the manuscript payload.
+_review_cache: "OrderedDict[str, ReviewResult]" = OrderedDict()
+_REVIEW_CACHE_MAX = 128
+
+
+def _review_cache_key(manuscript: Manuscript, *extra) -> str:
+    payload = orjson.dumps(manuscript.dict(), option=orjson.OPT_SORT_KEYS)
+    digest = hashlib.blake2b(payload).hexdigest()
+    return "|".join([digest, *map(str, extra)])
+
+
+def _review_cache_get(key: str):
+    result = _review_cache.get(key)
+    if result is not None:
+        _review_cache.move_to_end(key)
+    return result
+
+
+def _review_cache_put(key: str, result: ReviewResult) -> None:
+    _review_cache[key] = result
+    _review_cache.move_to_end(key)
+    while len(_review_cache) > _REVIEW_CACHE_MAX:
+        _review_cache.popitem(last=False)
+
+
+# ---------------------------------------------------------------------------
+# Parsed manuscript cache
+# ---------------------------------------------------------------------------
+# The typical frontend flow hits /review/parse and then /review/upload with
+# the same document, paying DOCX unzip + extraction twice. Parsed manuscripts
+# are memoized by a digest of the file contents, so the second request is a
+# dict lookup. Manuscripts are never mutated after extraction, so entries can
+# be shared between requests.
+_parse_cache: "OrderedDict[str, Manuscript]" = OrderedDict()
+_PARSE_CACHE_MAX = 64
+
+
+def _file_digest(path: Path) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        while chunk := f.read(_COPY_BUF):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+async def _extract_manuscript_cached(upload_bytes, tmp_path, filename):
+    """Extract a Manuscript from a staged upload, memoized by content digest."""
+    if upload_bytes is not None:
+        digest = hashlib.blake2b(upload_bytes, digest_size=16).hexdigest()
+    else:
+        digest = await asyncio.to_thread(_file_digest, tmp_path)
+
+    cached = _parse_cache.get(digest)
+    if cached is not None:
+        _parse_cache.move_to_end(digest)
+        logger.info(f"extract_manuscript | cache_hit digest={digest[:12]}")
+        return cached
+
+    if upload_bytes is not None:
+        manuscript = await asyncio.to_thread(
+            _ingest().extract_manuscript_from_bytes, upload_bytes, filename
+        )
+    else:
+        manuscript = await asyncio.to_thread(
+            _ingest().extract_manuscript_from_file, tmp_path
+        )
+
+    if manuscript is not None:
+        _parse_cache[digest] = manuscript
+        while len(_parse_cache) > _PARSE_CACHE_MAX:
+            _parse_cache.popitem(last=False)
+    return manuscript
+
+
+# 1 MiB copy buffer: multi-MB DOCX uploads move in a handful of syscalls
+# instead of the 64 KiB default chunking.
+_COPY_BUF = 1 << 20
+
+
+def _advise_sequential(fd: int) -> None:
+    """Hint the kernel that the staged file will be read once, start to end.
+
+    The extractor reads the spilled upload sequentially right after the copy
+    and the file is unlinked when the request finishes, so readahead helps
+    and long-term caching doesn't. Linux-only; a harmless no-op on tmpfs and
+    absent on platforms without posix_fadvise.
+    """
+    if hasattr(os, "posix_fadvise"):
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+
+async def _spill_upload_to_disk(file: UploadFile, tmp_path: Path) -> None:
+    """Copy an uploaded file to tmp_path without blocking the event loop.
+
+    Uploads large enough to roll Starlette's SpooledTemporaryFile onto disk
+    are copied kernel-to-kernel with os.sendfile; in-memory uploads are
+    drained with 1 MiB chunked aiofiles writes.
+    """
+    raw = file.file
+    if getattr(raw, "_rolled", False):
+        if hasattr(os, "sendfile"):
+
+            def _sendfile_copy():
+                size = os.fstat(raw.fileno()).st_size
+                with open(tmp_path, "wb") as out:
+                    offset = 0
+                    while offset < size:
+                        sent = os.sendfile(
+                            out.fileno(), raw.fileno(), offset, size - offset
+                        )
+                        if sent == 0:
+                            break
+                        offset += sent
+                    _advise_sequential(out.fileno())
+
+            await asyncio.to_thread(_sendfile_copy)
+            return
+
+        if hasattr(raw, "readinto"):
+            # No sendfile (non-Linux): readinto a preallocated buffer so each
+            # chunk reuses the same memory instead of allocating fresh bytes.
+            def _readinto_copy():
+                mv = memoryview(bytearray(_COPY_BUF))
+                read = raw.readinto
+                with open(tmp_path, "wb") as out:
+                    write = out.write
+                    while n := read(mv):
+                        write(mv[:n])
+                    _advise_sequential(out.fileno())
+
+            await asyncio.to_thread(_readinto_copy)
+            return
+
+    async with aiofiles.open(tmp_path, "wb") as out:
+        while chunk := await file.read(_COPY_BUF):
+            await out.write(chunk)
+
+
+# Stage rolled uploads on tmpfs when available so the transient copy never
+# touches real disk - in containers /tmp is often a slow overlayfs layer.
+# REVIEW_TMPDIR overrides; None falls back to the platform default.
+_UPLOAD_TMPDIR = os.environ.get("REVIEW_TMPDIR") or (
+    "/dev/shm" if Path("/dev/shm").is_dir() else None
+)
+
+_ALLOWED_UPLOAD_EXT = frozenset({".docx", ".doc"})
+
+
+async def _remove_upload(tmp_path: Path) -> None:
+    try:
+        await aiofiles.os.remove(tmp_path)
+    except FileNotFoundError:
+        pass
+
+
+@asynccontextmanager
+async def staged_upload(
+    file: UploadFile,
+    ctx: _ReqCtx,
+    endpoint: str,
+    background_tasks: BackgroundTasks = None,
+):
+    """Validate and stage an uploaded manuscript, cleaning up on exit.
+
+    Rejects non-Word uploads with a 400, then stages the payload: small
+    uploads are read straight out of Starlette's in-memory spool, rolled
+    (large) uploads are spilled to a temp file. Yields (tmp_path,
+    upload_bytes) - exactly one is set - and removes the temp file when
+    the handler exits, on success or failure. When background_tasks is
+    given the unlink is deferred until after the response has been sent,
+    keeping the metadata syscall off the request path.
+    """
+    suffix = Path(file.filename or "").suffix.lower()
+    if suffix not in _ALLOWED_UPLOAD_EXT:
+        ctx.log.warning("%s | invalid_file_type filename=%s", endpoint, file.filename)
+        raise HTTPException(
+            status_code=400,
+            detail="Only Word documents (.docx, .doc) are currently supported",
+        )
+
+    tmp_path = None
+    upload_bytes = None
+    if not getattr(file.file, "_rolled", False):
+        upload_bytes = await file.read()
+        ctx.log.info(
+            "%s | file_buffered name=%s size_bytes=%d",
+            endpoint,
+            file.filename,
+            len(upload_bytes),
+        )
+    else:
+        async with aiofiles.tempfile.NamedTemporaryFile(
+            "wb", dir=_UPLOAD_TMPDIR, suffix=suffix, delete=False
+        ) as tmp_file:
+            tmp_path = Path(tmp_file.name)
+        await _spill_upload_to_disk(file, tmp_path)
+        file_size = (await aiofiles.os.stat(tmp_path)).st_size
+        ctx.log.info(
+            "%s | file_saved name=%s size_bytes=%d", endpoint, file.filename, file_size
+        )
+    try:
+        yield tmp_path, upload_bytes
+    except BaseException:
+        # An error response built by an exception handler never runs the
+        # request's background tasks, so clean up inline on failure.
+        if tmp_path is not None:
+            await _remove_upload(tmp_path)
+        raise
+    else:
+        if tmp_path is not None:
+            if background_tasks is not None:
+                background_tasks.add_task(_remove_upload, tmp_path)
+            else:
+                await _remove_upload(tmp_path)
+
+
+async def _ingest_upload(
+    file: UploadFile,
+    ctx: _ReqCtx,
+    endpoint: str,
+    background_tasks: BackgroundTasks = None,
+):
+    """Stage, extract and summarize an uploaded manuscript.
+
+    The one implementation of the validate -> stage -> digest-cache ->
+    extract pipeline shared by the upload endpoints, so buffer sizes,
+    caching and cleanup choices live in a single place. Raises 400 for a
+    rejected extension (via staged_upload) and 422 when extraction yields
+    nothing; otherwise returns (manuscript, extraction_info).
+    """
+    async with staged_upload(file, ctx, endpoint, background_tasks) as (
+        tmp_path,
+        upload_bytes,
+    ):
+        t_ext_start = time.perf_counter()
+        ctx.log.info("%s | extraction_start", endpoint)
+        manuscript = await _extract_manuscript_cached(
+            upload_bytes, tmp_path, file.filename
+        )
+        t_ext_end = time.perf_counter()
+        ctx.log.info(
+            "%s | extraction_done duration_ms=%.1f title_present=%s studies=%d",
+            endpoint,
+            (t_ext_end - t_ext_start) * 1000,
+            manuscript.title is not None if manuscript else False,
+            len(manuscript.included_studies) if manuscript and manuscript.included_studies else 0,
+        )
+
+        # Raised inside the context so staged_upload cleans the spilled file
+        # up inline - background tasks don't run on error responses.
+        if manuscript is None:
+            ctx.log.error("%s | extraction_failed null_manuscript", endpoint)
+            raise HTTPException(
+                status_code=422,
+                detail="Failed to extract manuscript data from uploaded file. "
+                "Please ensure the document contains systematic review content with "
+                "clear PICO elements, search strategies, and study data.",
+            )
+    return manuscript, _build_extraction_info(file.filename, manuscript)
+
+
+def _build_extraction_info(filename, manuscript):
+    """Summarize which manuscript elements were recovered from an upload.
+
+    Values are checked, not model_fields_set membership - the extractor
+    passes explicit Nones, so every field always counts as "set".
+    """
+    search = manuscript.search
+    studies = manuscript.included_studies
+    return {
+        "source_file": filename,
+        "manuscript_id": manuscript.manuscript_id,
+        "extracted_elements": {
+            "title": manuscript.title is not None,
+            "pico": manuscript.question is not None,
+            "search_strategies": len(search) if search else 0,
+            "flow_counts": manuscript.flow is not None,
+            "studies": len(studies) if studies else 0,
+        },
+    }
+
+
+def _sse_response(generator):
+    """Serve an async generator of JSON frame bytes as Server-Sent Events.
+
+    Frames are data:-framed here as bytes; sse-starlette passes pre-framed
+    bytes through untouched, which skips its per-event str() round-trip and
+    line-splitting (safe because JSON escapes newlines). EventSourceResponse
+    still adds cache/keep-alive headers and periodic pings so proxies don't
+    time out during long LLM runs; without sse-starlette the same framed
+    bytes go over a plain StreamingResponse (no pings).
+    """
+
+    async def _framed():
+        async for frame in generator:
+            if isinstance(frame, str):
+                frame = frame.encode()
+            yield b"data: " + frame + b"\r\n\r\n"
+
+    if EventSourceResponse is not None:
+        return EventSourceResponse(_framed(), ping=15)
+
+    return StreamingResponse(_framed(), media_type="text/event-stream")
+
+
+async def _iterate_in_thread(gen):
+    """Drive a synchronous generator from async code without blocking the loop.
+
+    Each next() call runs on the threadpool, so slow orchestrator steps don't
+    stall other requests while the SSE generator waits for the next event.
+    """
+    sentinel = object()
+    while True:
+        item = await asyncio.to_thread(next, gen, sentinel)
+        if item is sentinel:
+            break
+        yield item
+
+
+_STREAM_DONE = object()
+
+# Log frames share constant keys, so build them by bytes interpolation
+# instead of allocating a dict per line - a chatty review emits thousands.
+# orjson still encodes the message itself, keeping the escaping correct.
+_LOG_FRAME = b'{"event_type":"log","sequence":%d,"message":%s}'
+_LOG_BATCH_FRAME = b'{"event_type":"log_batch","sequence":%d,"messages":%s}'
+
+
+
+# A burst of log records becomes one frame: each SSE frame costs an ASGI
+# send, so batching amortizes framing and socket writes over the burst.
+_LOG_BATCH_MAX = 32
+
+
+def _drain_log_burst(log_queue, lines):
+    """Extend lines with whatever else is already queued, up to the batch cap."""
+    while len(lines) < _LOG_BATCH_MAX and not log_queue.empty():
+        lines.append(log_queue.get_nowait())
+    return lines
+
+
+async def _merge_events_and_logs(event_gen, log_queue):
+    """Interleave orchestrator events with log lines as each arrives.
+
+    Yields ("event", StreamingEvent) and ("log", [line, ...]) pairs. Racing
+    the two sources with FIRST_COMPLETED forwards log lines the moment they
+    are emitted - even mid-agent - instead of holding them until the next
+    orchestrator event, while preserving ordering within each source. Log
+    lines that are already queued when one is forwarded ride along in the
+    same batch rather than paying a frame each.
+    """
+    evt_task = asyncio.create_task(anext(event_gen, _STREAM_DONE))
+    log_task = asyncio.create_task(log_queue.get())
+    try:
+        while True:
+            done, _ = await asyncio.wait(
+                {evt_task, log_task}, return_when=asyncio.FIRST_COMPLETED
+            )
+            if log_task in done:
+                yield "log", _drain_log_burst(log_queue, [log_task.result()])
+                log_task = asyncio.create_task(log_queue.get())
+            if evt_task in done:
+                event = evt_task.result()
+                if event is _STREAM_DONE:
+                    break
+                yield "event", event
+                evt_task = asyncio.create_task(anext(event_gen, _STREAM_DONE))
+    finally:
+        evt_task.cancel()
+        log_task.cancel()
+    # Flush any log lines that landed after the last orchestrator event
+    while not log_queue.empty():
+        yield "log", _drain_log_burst(log_queue, [])
+
+
 @app.get("/health")
 def health():
     return {"status": "ok"}
 
 
-@app.post("/review/start", response_model=ReviewResult)
-def start_review(manuscript: Manuscript):
-    """Review a manuscript from structured JSON data."""
-    return run_multi_agent_review(manuscript)
+@app.post("/review/start")
+async def start_review(manuscript: Manuscript):
+    """Review a manuscript from structured JSON data.
+
+    Responds with a ReviewResult payload (see app.models.schemas). The
+    orchestrator already returns a validated ReviewResult, so the response
+    is serialized directly instead of being re-validated by FastAPI's
+    response_model machinery - see tests/unit/test_schemas.py for the
+    pinned contract.
+    """
+    cache_key = _review_cache_key(manuscript)
+    cached = _review_cache_get(cache_key)
+    if cached is not None:
+        logger.info(f"start_review | cache_hit key={cache_key[:16]}")
+        return ORJSONResponse(cached.dict())
+    # Offload the CPU/LLM-heavy review so the event loop stays free
+    result = await asyncio.to_thread(_orchestrator().run_multi_agent_review, manuscript)
+    _review_cache_put(cache_key, result)
+    return ORJSONResponse(result.dict())
 
 
 @app.post("/review/start/stream")
-def start_review_streaming(manuscript: Manuscript):
-    """Review a manuscript with streaming progress updates via Server-Sent Events."""
+async def start_review_streaming(request: Request, manuscript: Manuscript):
+    """Review a manuscript with streaming progress updates.
 
-    def generate_events():
+    Serves Server-Sent Events by default; clients that send
+    `Accept: application/x-ndjson` (internal service-to-service callers)
+    get the same frames as newline-delimited JSON without SSE framing.
+    """
+
+    async def generate_events():
         seq = 0
-        last_heartbeat = time.time()
         ensure_handler_installed()
-        log_queue, callback = register_listener()
+        log_queue, callback = register_async_listener()
         try:
-            for event in run_multi_agent_review_streaming(manuscript):
-                # Send heartbeat every 10 seconds to prevent connection timeout
-                current_time = time.time()
-                if current_time - last_heartbeat > 10:
-                    seq += 1
-                    yield f"data: {json.dumps({'event_type':'heartbeat','sequence': seq,'timestamp': current_time})}\n\n"
-                    last_heartbeat = current_time
-                # Drain pending logs first
-                while not log_queue.empty():
-                    log_line = log_queue.get()
+            async for kind, payload in _merge_events_and_logs(
+                _iterate_in_thread(
+                    _orchestrator().run_multi_agent_review_streaming(manuscript)
+                ),
+                log_queue,
+            ):
+                # Abandoned stream: stop driving the orchestrator generator so
+                # no further agents (and their LLM calls) run for nobody.
+                if await request.is_disconnected():
+                    logger.info(
+                        "start_review_streaming | client_disconnected, aborting analysis"
+                    )
+                    break
+                if kind == "log":
                     seq += 1
-                    yield f"data: {json.dumps({'event_type':'log','sequence': seq,'message': log_line})}\n\n"
-                data = {
-                    "event_type": event.event_type,
-                    "agent": event.agent,
-                    "message": event.message,
-                    "data": event.data,
-                    "timestamp": event.timestamp,
-                    "sequence": seq,
-                }
-                yield f"data: {json.dumps(data)}\n\n"
-                seq += 1
-            # Final drain
-            while not log_queue.empty():
-                log_line = log_queue.get()
+                    if len(payload) == 1:
+                        yield _LOG_FRAME % (seq, orjson.dumps(payload[0]))
+                    else:
+                        yield _LOG_BATCH_FRAME % (seq, orjson.dumps(payload))
+                    continue
+                # Pydantic v2's compiled serializer emits JSON straight from
+                # the model in C - no intermediate dict per event.
+                payload.sequence = seq
+                yield payload.model_dump_json(exclude_none=True).encode()
                 seq += 1
-                yield f"data: {json.dumps({'event_type':'log','sequence': seq,'message': log_line})}\n\n"
         except Exception as e:
             error_data = {
                 "event_type": "error",
@@ -137,304 +656,224 @@ def start_review_streaming(manuscript: Manuscript):
                 "timestamp": "now",
                 "sequence": seq,
             }
-            yield f"data: {json.dumps(error_data)}\n\n"
+            yield orjson.dumps(error_data)
         finally:
             unregister_listener(callback)
 
-    return StreamingResponse(
-        generate_events(),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache, no-store, must-revalidate",
-            "Connection": "keep-alive",
-            "Access-Control-Allow-Origin": "*",
-            "Access-Control-Allow-Headers": "Cache-Control",
-            "X-Accel-Buffering": "no",  # Disable nginx buffering
-            "CF-Cache-Status": "BYPASS",  # Tell Cloudflare not to cache
-            "Alt-Svc": 'h2=":443"',  # Force HTTP/2 instead of HTTP/3
-            "CF-H2-Prioritization": "on",  # Enable HTTP/2 prioritization
-            "Transfer-Encoding": "chunked",  # Explicit chunked encoding
-        },
-    )
+    # Every frame is already a JSON string, so the NDJSON variant just
+    # newline-terminates them instead of wrapping in data:/blank-line framing.
+    if "application/x-ndjson" in request.headers.get("accept", ""):
 
+        async def ndjson_stream():
+            async for frame in generate_events():
+                yield frame + b"\n"
 
-@app.post("/review/enhanced", response_model=ReviewResult)
-def start_enhanced_review(manuscript: Manuscript, use_llm: bool = True):
-    """Enhanced review with LLM-powered analysis when available."""
-    return run_enhanced_multi_agent_review(manuscript, use_llm=use_llm)
+        return StreamingResponse(ndjson_stream(), media_type="application/x-ndjson")
 
+    return _sse_response(generate_events())
 
-@app.post("/review/upload", response_model=ReviewResult)
-async def upload_and_review(file: UploadFile = File(...)):
-    """Upload and review a manuscript from DOCX file."""
-    request_id = uuid.uuid4().hex[:8]
-    t_request_start = time.perf_counter()
 
-    # Validate file type
-    if not file.filename or not file.filename.lower().endswith((".docx", ".doc")):
-        logger.warning(
-            f"{request_id} | upload_and_review | invalid_file_type filename={file.filename}"
-        )
-        raise HTTPException(
-            status_code=400,
-            detail="Only Word documents (.docx, .doc) are currently supported",
-        )
+@app.post("/review/simple/stream")
+async def start_simple_review_stream(manuscript: Manuscript):
+    """Stream per-agent review chunks as newline-delimited JSON.
+
+    Each line is {"agent": name, "result": ...} emitted as soon as that
+    agent finishes, so clients see the fastest agent's issues at roughly
+    its own latency instead of waiting for the slowest.
+    """
+
+    async def ndjson_stream():
+        async for name, chunk in _simple_orchestrator().simple_review_stream(
+            manuscript
+        ):
+            if isinstance(chunk, list):
+                payload = [item.dict() for item in chunk]
+            else:
+                payload = chunk.dict()
+            yield orjson.dumps({"agent": name, "result": payload}) + b"\n"
+
+    return StreamingResponse(ndjson_stream(), media_type="application/x-ndjson")
+
+
+@app.post("/review/enhanced")
+async def start_enhanced_review(manuscript: Manuscript, use_llm: bool = True):
+    """Enhanced review with LLM-powered analysis when available.
 
-    # Create temporary file
-    with tempfile.NamedTemporaryFile(
-        delete=False, suffix=Path(file.filename).suffix
-    ) as tmp_file:
-        # Copy uploaded content to temporary file
-        shutil.copyfileobj(file.file, tmp_file)
-        tmp_path = Path(tmp_file.name)
-
-    file_size = tmp_path.stat().st_size if tmp_path.exists() else -1
-    logger.info(
-        f"{request_id} | upload_and_review | file_saved name={file.filename} size_bytes={file_size}"
+    Responds with a ReviewResult payload, serialized without response_model
+    re-validation (the orchestrator already returns the validated model).
+    """
+    cache_key = _review_cache_key(manuscript, use_llm)
+    cached = _review_cache_get(cache_key)
+    if cached is not None:
+        logger.info(f"start_enhanced_review | cache_hit key={cache_key[:16]}")
+        return ORJSONResponse(cached.dict())
+    # Agents are independent, so the async path fans them out concurrently
+    # instead of paying each agent's LLM wait time in sequence.
+    result = await _orchestrator().run_enhanced_multi_agent_review_async(
+        manuscript, use_llm=use_llm
     )
+    _review_cache_put(cache_key, result)
+    return ORJSONResponse(result.dict())
+
+
+@app.post("/review/upload")
+async def upload_and_review(
+    background_tasks: BackgroundTasks, file: UploadFile = File(...)
+):
+    """Upload and review a manuscript from DOCX file.
+
+    Responds with a ReviewResult payload (including the parsed manuscript
+    and extraction summary), serialized without response_model re-validation.
+    """
+    ctx = _req_ctx()
 
     try:
-        # Extract manuscript from file
-        t_ext_start = time.perf_counter()
-        logger.info(f"{request_id} | upload_and_review | extraction_start")
-        manuscript = extract_manuscript_from_file(tmp_path)
-        t_ext_end = time.perf_counter()
-        logger.info(
-            f"{request_id} | upload_and_review | extraction_done duration_ms={(t_ext_end - t_ext_start)*1000:.1f} title_present={manuscript.title is not None if manuscript else False} studies={len(manuscript.included_studies) if manuscript and manuscript.included_studies else 0}"
+        manuscript, extraction_info = await _ingest_upload(
+            file, ctx, "upload_and_review", background_tasks
         )
 
-        if manuscript is None:
-            logger.error(
-                f"{request_id} | upload_and_review | extraction_failed null_manuscript"
-            )
-            raise HTTPException(
-                status_code=422,
-                detail="Failed to extract manuscript data from uploaded file. "
-                "Please ensure the document contains systematic review content with "
-                "clear PICO elements, search strategies, and study data.",
-            )
-
         # Run the review
         t_review_start = time.perf_counter()
-        logger.info(f"{request_id} | upload_and_review | review_start")
-        result = run_multi_agent_review(manuscript)
+        ctx.log.info("upload_and_review | review_start")
+        result = await asyncio.to_thread(
+            _orchestrator().run_multi_agent_review, manuscript
+        )
         t_review_end = time.perf_counter()
-        logger.info(
-            f"{request_id} | upload_and_review | review_done duration_ms={(t_review_end - t_review_start)*1000:.1f}"
+        ctx.log.info(
+            "upload_and_review | review_done duration_ms=%.1f",
+            (t_review_end - t_review_start) * 1000,
         )
         # attach original manuscript structure for frontend editing/use
         result.manuscript = manuscript
 
         # Add extraction info to response
-        result.extraction_info = {
-            "source_file": file.filename,
-            "manuscript_id": manuscript.manuscript_id,
-            "extracted_elements": {
-                "title": manuscript.title is not None,
-                "pico": manuscript.question is not None,
-                "search_strategies": len(manuscript.search) if manuscript.search else 0,
-                "flow_counts": manuscript.flow is not None,
-                "studies": (
-                    len(manuscript.included_studies)
-                    if manuscript.included_studies
-                    else 0
-                ),
-            },
-        }
-        t_request_end = time.perf_counter()
-        logger.info(
-            f"{request_id} | upload_and_review | success total_duration_ms={(t_request_end - t_request_start)*1000:.1f}"
+        result.extraction_info = extraction_info
+        ctx.log.info(
+            "upload_and_review | success total_duration_ms=%.1f", ctx.elapsed_ms()
         )
-        return result
+        return ORJSONResponse(result.dict())
 
     except HTTPException:
         # already logged above; just re-raise
-        t_request_end = time.perf_counter()
-        logger.exception(
-            f"{request_id} | upload_and_review | http_exception total_duration_ms={(t_request_end - t_request_start)*1000:.1f}"
+        ctx.log.exception(
+            "upload_and_review | http_exception total_duration_ms=%.1f",
+            ctx.elapsed_ms(),
         )
         raise
     except Exception as e:
-        t_request_end = time.perf_counter()
-        logger.exception(
-            f"{request_id} | upload_and_review | unexpected_error total_duration_ms={(t_request_end - t_request_start)*1000:.1f} error={e}"
+        ctx.log.exception(
+            "upload_and_review | unexpected_error total_duration_ms=%.1f error=%s",
+            ctx.elapsed_ms(),
+            e,
         )
         raise HTTPException(
             status_code=500, detail=f"Error processing uploaded file: {str(e)}"
         )
-    finally:
-        # Clean up temporary file
-        if tmp_path.exists():
-            tmp_path.unlink()
 
 
 @app.post("/review/parse", response_model=Manuscript)
-async def parse_manuscript(file: UploadFile = File(...)):
+async def parse_manuscript(
+    background_tasks: BackgroundTasks, file: UploadFile = File(...)
+):
     """Parse a DOCX/DOC manuscript and return structured Manuscript without running analysis.
 
     This is a lightweight endpoint for the frontend to quickly obtain parsed JSON
     before initiating the heavier multi-agent review. Avoids user-facing stall during
     full analysis when they only expect parsing feedback.
     """
-    request_id = uuid.uuid4().hex[:8]
-    t_req_start = time.perf_counter()
-    if not file.filename or not file.filename.lower().endswith((".docx", ".doc")):
-        logger.warning(
-            f"{request_id} | parse_manuscript | invalid_file_type filename={file.filename}"
-        )
-        raise HTTPException(
-            status_code=400, detail="Only Word documents (.docx, .doc) are supported"
-        )
-
-    with tempfile.NamedTemporaryFile(
-        delete=False, suffix=Path(file.filename).suffix
-    ) as tmp_file:
-        shutil.copyfileobj(file.file, tmp_file)
-        tmp_path = Path(tmp_file.name)
-
-    file_size = tmp_path.stat().st_size if tmp_path.exists() else -1
-    logger.info(
-        f"{request_id} | parse_manuscript | file_saved name={file.filename} size_bytes={file_size}"
-    )
-
+    ctx = _req_ctx()
     try:
-        t_ext_start = time.perf_counter()
-        logger.info(f"{request_id} | parse_manuscript | extraction_start")
-        manuscript = extract_manuscript_from_file(tmp_path)
-        t_ext_end = time.perf_counter()
-        logger.info(
-            f"{request_id} | parse_manuscript | extraction_done duration_ms={(t_ext_end - t_ext_start)*1000:.1f} title_present={manuscript.title is not None if manuscript else False} studies={len(manuscript.included_studies) if manuscript and manuscript.included_studies else 0}"
+        manuscript, _ = await _ingest_upload(
+            file, ctx, "parse_manuscript", background_tasks
         )
-        if manuscript is None:
-            logger.error(
-                f"{request_id} | parse_manuscript | extraction_failed null_manuscript"
-            )
-            raise HTTPException(
-                status_code=422,
-                detail="Failed to extract manuscript data. Ensure document contains systematic review sections.",
-            )
-        t_req_end = time.perf_counter()
-        logger.info(
-            f"{request_id} | parse_manuscript | success total_duration_ms={(t_req_end - t_req_start)*1000:.1f}"
+        ctx.log.info(
+            "parse_manuscript | success total_duration_ms=%.1f", ctx.elapsed_ms()
         )
         return manuscript
     except HTTPException:
-        t_req_end = time.perf_counter()
-        logger.exception(
-            f"{request_id} | parse_manuscript | http_exception total_duration_ms={(t_req_end - t_req_start)*1000:.1f}"
+        ctx.log.exception(
+            "parse_manuscript | http_exception total_duration_ms=%.1f",
+            ctx.elapsed_ms(),
         )
         raise
     except Exception as e:
-        t_req_end = time.perf_counter()
-        logger.exception(
-            f"{request_id} | parse_manuscript | unexpected_error total_duration_ms={(t_req_end - t_req_start)*1000:.1f} error={e}"
+        ctx.log.exception(
+            "parse_manuscript | unexpected_error total_duration_ms=%.1f error=%s",
+            ctx.elapsed_ms(),
+            e,
         )
         raise HTTPException(status_code=500, detail=f"Error parsing file: {str(e)}")
-    finally:
-        if tmp_path.exists():
-            tmp_path.unlink()
 
 
 @app.post("/review/upload/stream")
-async def upload_and_review_streaming(file: UploadFile = File(...)):
+async def upload_and_review_streaming(
+    request: Request, background_tasks: BackgroundTasks, file: UploadFile = File(...)
+):
     """Upload and review a manuscript from DOCX file with streaming progress."""
 
-    request_id = uuid.uuid4().hex[:8]
-    t_req_start = time.perf_counter()
-    # Validate file type
-    if not file.filename or not file.filename.lower().endswith((".docx", ".doc")):
-        logger.warning(
-            f"{request_id} | upload_and_review_streaming | invalid_file_type filename={file.filename}"
-        )
-        raise HTTPException(
-            status_code=400,
-            detail="Only Word documents (.docx, .doc) are currently supported",
-        )
-
-    # Create temporary file
-    with tempfile.NamedTemporaryFile(
-        delete=False, suffix=Path(file.filename).suffix
-    ) as tmp_file:
-        # Copy uploaded content to temporary file
-        shutil.copyfileobj(file.file, tmp_file)
-        tmp_path = Path(tmp_file.name)
-
-    file_size = tmp_path.stat().st_size if tmp_path.exists() else -1
-    logger.info(
-        f"{request_id} | upload_and_review_streaming | file_saved name={file.filename} size_bytes={file_size}"
-    )
-
+    ctx = _req_ctx()
     try:
-        # Extract manuscript from file
-        t_ext_start = time.perf_counter()
-        logger.info(f"{request_id} | upload_and_review_streaming | extraction_start")
-        manuscript = extract_manuscript_from_file(tmp_path)
-        t_ext_end = time.perf_counter()
-        logger.info(
-            f"{request_id} | upload_and_review_streaming | extraction_done duration_ms={(t_ext_end - t_ext_start)*1000:.1f} title_present={manuscript.title is not None if manuscript else False} studies={len(manuscript.included_studies) if manuscript and manuscript.included_studies else 0}"
+        manuscript, extraction_info = await _ingest_upload(
+            file, ctx, "upload_and_review_streaming", background_tasks
         )
 
-        if manuscript is None:
-            raise HTTPException(
-                status_code=422,
-                detail="Failed to extract manuscript data from uploaded file. "
-                "Please ensure the document contains systematic review content with "
-                "clear PICO elements, search strategies, and study data.",
-            )
+        # Encode the extraction event before entering the generator - it is
+        # static for the stream, so the frame bytes are built exactly once
+        # rather than closed over and serialized on first yield.
+        extraction_frame = orjson.dumps(
+            {
+                "event_type": "extraction_complete",
+                "sequence": 0,
+                "message": "Document extracted successfully",
+                "data": extraction_info,
+            }
+        )
 
-        # Add extraction info to streaming data
-        extraction_info = {
-            "source_file": file.filename,
-            "manuscript_id": manuscript.manuscript_id,
-            "extracted_elements": {
-                "title": manuscript.title is not None,
-                "pico": manuscript.question is not None,
-                "search_strategies": len(manuscript.search) if manuscript.search else 0,
-                "flow_counts": manuscript.flow is not None,
-                "studies": (
-                    len(manuscript.included_studies)
-                    if manuscript.included_studies
-                    else 0
-                ),
-            },
-        }
+        # Serialize the manuscript once per stream with pydantic's compiled
+        # serializer. The synthesized frames splice the pre-encoded bytes in
+        # via orjson.Fragment, and the complete event reuses the decoded
+        # payload, so the model is never re-walked with .dict() per frame.
+        manuscript_json = manuscript.model_dump_json().encode()
+        manuscript_payload = orjson.loads(manuscript_json)
 
-        def generate_events():
+        async def generate_events():
             seq = 0
-            last_heartbeat = time.time()
             try:
-                logger.info(
-                    f"{request_id} | upload_and_review_streaming | streaming_start"
-                )
+                ctx.log.info("upload_and_review_streaming | streaming_start")
                 # Yield extraction event first
-                yield f"data: {json.dumps({'event_type': 'extraction_complete', 'sequence': seq, 'message': 'Document extracted successfully', 'data': extraction_info})}\n\n"
+                yield extraction_frame
                 seq += 1
                 # Register log listener
                 ensure_handler_installed()
-                log_queue, callback = register_listener()
+                log_queue, callback = register_async_listener()
                 try:
-                    # Then stream the analysis events
+                    # Then stream the analysis events, interleaved with
+                    # log lines as they are emitted
                     final_complete_payload = None
-                    for event in run_multi_agent_review_streaming(manuscript):
-                        # Send heartbeat every 10 seconds to prevent connection timeout
-                        current_time = time.time()
-                        if current_time - last_heartbeat > 10:
+                    async for kind, payload in _merge_events_and_logs(
+                        _iterate_in_thread(
+                            _orchestrator().run_multi_agent_review_streaming(
+                                manuscript
+                            )
+                        ),
+                        log_queue,
+                    ):
+                        # Abandoned stream: stop driving the orchestrator
+                        # generator so no further agents run for nobody.
+                        if await request.is_disconnected():
+                            ctx.log.info(
+                                "upload_and_review_streaming | client_disconnected, aborting analysis"
+                            )
+                            break
+                        if kind == "log":
                             seq += 1
-                            yield f"data: {json.dumps({'event_type':'heartbeat','sequence': seq,'timestamp': current_time})}\n\n"
-                            last_heartbeat = current_time
-                        # Drain log queue before each event
-                        while not log_queue.empty():
-                            log_line = log_queue.get()
-                            seq += 1
-                            yield f"data: {json.dumps({'event_type':'log','sequence': seq,'message': log_line})}\n\n"
-                        data = {
-                            "event_type": event.event_type,
-                            "agent": event.agent,
-                            "message": event.message,
-                            "data": event.data,
-                            "timestamp": event.timestamp,
-                            "sequence": seq,
-                        }
+                            if len(payload) == 1:
+                                yield _LOG_FRAME % (seq, orjson.dumps(payload[0]))
+                            else:
+                                yield _LOG_BATCH_FRAME % (seq, orjson.dumps(payload))
+                            continue
+                        event = payload
+                        event.sequence = seq
                         # Capture complete event so we can ensure manuscript presence
                         if event.event_type == "complete" and event.data:
                             # ensure manuscript embedded in result
@@ -442,15 +881,12 @@ async def upload_and_review_streaming(file: UploadFile = File(...)):
                                 event.data.get("result")
                                 and "manuscript" not in event.data["result"]
                             ):
-                                event.data["result"]["manuscript"] = manuscript.dict()
-                            final_complete_payload = data
-                        yield f"data: {json.dumps(data)}\n\n"
-                        seq += 1
-                    # Final drain
-                    while not log_queue.empty():
-                        log_line = log_queue.get()
+                                event.data["result"]["manuscript"] = manuscript_payload
+                            final_complete_payload = True
+                        # Pydantic v2's compiled serializer emits JSON straight
+                        # from the model in C - no intermediate dict per event.
+                        yield event.model_dump_json(exclude_none=True).encode()
                         seq += 1
-                        yield f"data: {json.dumps({'event_type':'log','sequence': seq,'message': log_line})}\n\n"
                 finally:
                     unregister_listener(callback)
                 # If somehow the streaming implementation didn't emit a complete event, synthesize one
@@ -464,16 +900,17 @@ async def upload_and_review_streaming(file: UploadFile = File(...)):
                                 "issues": [],
                                 "meta": [],
                                 "analysis_metadata": None,
-                                "manuscript": manuscript.dict(),
+                                "manuscript": orjson.Fragment(manuscript_json),
                             }
                         },
                     }
-                    yield f"data: {json.dumps(synth_payload)}\n\n"
+                    yield orjson.dumps(synth_payload)
                     seq += 1
                 # final manuscript payload event (still emit for backward compatibility / debug)
-                yield f"data: {json.dumps({'event_type':'manuscript','sequence': seq, 'message':'Original manuscript attached','data': {'manuscript': manuscript.dict()}})}\n\n"
-                logger.info(
-                    f"{request_id} | upload_and_review_streaming | streaming_complete total_events={seq+1}"
+                yield orjson.dumps({'event_type':'manuscript','sequence': seq, 'message':'Original manuscript attached','data': {'manuscript': orjson.Fragment(manuscript_json)}})
+                ctx.log.info(
+                    "upload_and_review_streaming | streaming_complete total_events=%d",
+                    seq + 1,
                 )
             except Exception as e:
                 error_data = {
@@ -481,57 +918,35 @@ async def upload_and_review_streaming(file: UploadFile = File(...)):
                     "message": f"Streaming failed: {str(e)}",
                     "timestamp": "now",
                 }
-                logger.exception(
-                    f"{request_id} | upload_and_review_streaming | streaming_error error={e}"
+                ctx.log.exception(
+                    "upload_and_review_streaming | streaming_error error=%s", e
                 )
-                yield f"data: {json.dumps(error_data)}\n\n"
-
-        return StreamingResponse(
-            generate_events(),
-            media_type="text/event-stream",
-            headers={
-                "Cache-Control": "no-cache, no-store, must-revalidate",
-                "Connection": "keep-alive",
-                "Access-Control-Allow-Origin": "*",
-                "Access-Control-Allow-Headers": "Cache-Control",
-                "X-Accel-Buffering": "no",  # Disable nginx buffering
-                "CF-Cache-Status": "BYPASS",  # Tell Cloudflare not to cache
-                "Alt-Svc": 'h2=":443"',  # Force HTTP/2 instead of HTTP/3
-                "CF-H2-Prioritization": "on",  # Enable HTTP/2 prioritization
-                "Transfer-Encoding": "chunked",  # Explicit chunked encoding
-            },
-        )
+                yield orjson.dumps(error_data)
+
+        return _sse_response(generate_events())
 
     except HTTPException:
-        t_req_end = time.perf_counter()
-        logger.exception(
-            f"{request_id} | upload_and_review_streaming | http_exception total_duration_ms={(t_req_end - t_req_start)*1000:.1f}"
+        ctx.log.exception(
+            "upload_and_review_streaming | http_exception total_duration_ms=%.1f",
+            ctx.elapsed_ms(),
         )
         raise
     except Exception as e:
-        t_req_end = time.perf_counter()
-        logger.exception(
-            f"{request_id} | upload_and_review_streaming | unexpected_error total_duration_ms={(t_req_end - t_req_start)*1000:.1f} error={e}"
+        ctx.log.exception(
+            "upload_and_review_streaming | unexpected_error total_duration_ms=%.1f error=%s",
+            ctx.elapsed_ms(),
+            e,
         )
         raise HTTPException(
             status_code=500, detail=f"Error processing uploaded file: {str(e)}"
         )
 
-    finally:
-        # Clean up temporary file
-        if tmp_path.exists():
-            tmp_path.unlink()
-        else:
-            logger.warning(
-                f"{request_id} | upload_and_review_streaming | tmp_file_missing_for_cleanup"
-            )
-
 
 @app.get("/upload/info")
 def upload_info():
     """Get information about supported upload formats and requirements."""
     return {
-        "supported_formats": [".docx", ".doc"],
+        "supported_formats": sorted(_ALLOWED_UPLOAD_EXT, reverse=True),
         "requirements": {
             "document_structure": "Should contain systematic review sections",
             "pico_elements": "Population, Intervention, Comparator, Outcomes should be clearly stated",
@@ -553,8 +968,6 @@ def upload_info():
 def llm_status():
     """Get LLM integration status and available models."""
     try:
-        from app.services.llm_config import get_llm_environment
-
         env = get_llm_environment()
         status = env.validate_setup()
         return {
@@ -577,8 +990,6 @@ def llm_status():
 def llm_models():
     """Get available LLM models and their recommended use cases."""
     try:
-        from app.services.llm_config import get_llm_environment
-
         env = get_llm_environment()
         models = {}
         for model_id, config in env.settings.models.items():
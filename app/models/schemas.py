@@ -1,17 +1,84 @@
-from pydantic import BaseModel, Field, validator
-from typing import List, Optional, Literal, Dict, Any
+from enum import Enum
+
+from pydantic import BaseModel, ConfigDict, Field
+from typing import List, Optional, Dict, Any
+
+
+# str-subclass enums instead of Literal unions: pydantic-core validates by
+# hashed member lookup rather than scanning the alternatives, repeated values
+# share the interned member instead of a fresh string per instance, and the
+# members still compare and serialize as their plain string values.
+class EffectMetric(str, Enum):
+    MD = "MD"
+    SMD = "SMD"
+    OR = "OR"
+    RR = "RR"
+    HR = "HR"
+    logOR = "logOR"
+    logRR = "logRR"
+    logHR = "logHR"
+
+
+class PICOFramework(str, Enum):
+    PICO = "PICO"
+    PECO = "PECO"
+    PS = "PS"
+    OTHER = "Other"
+
+
+class Severity(str, Enum):
+    LOW = "low"
+    MEDIUM = "medium"
+    HIGH = "high"
+
+
+class IssueCategory(str, Enum):
+    PICO = "PICO"
+    PRISMA = "PRISMA"
+    STATS = "STATS"
+    DATA = "DATA"
+    OTHER = "OTHER"
+
+
+class PoolingModel(str, Enum):
+    FIXED = "fixed"
+    RANDOM = "random"
+
+
+class AnalysisMethodType(str, Enum):
+    RULE_BASED = "rule-based"
+    LLM_ENHANCED = "llm-enhanced"
+    HYBRID = "hybrid"
+    SKIPPED = "skipped"
+
+
+class StreamingEventType(str, Enum):
+    AGENT_START = "agent_start"
+    AGENT_COMPLETE = "agent_complete"
+    PROGRESS = "progress"
+    COMPLETE = "complete"
+    ERROR = "error"
+
+# Value models that are built in bulk during extraction/analysis and never
+# reassigned afterwards are frozen: pydantic skips the __setattr__ machinery
+# and instances can be shared safely (e.g. the parsed-manuscript cache).
+# Manuscript, MetaResult, StreamingEvent and ReviewResult stay mutable -
+# agents and endpoints assign to them after construction.
+_FROZEN = ConfigDict(frozen=True)
 
 
 class OutcomeEffect(BaseModel):
+    model_config = _FROZEN
+
     name: str
-    effect_metric: Literal["MD", "SMD", "OR", "RR", "HR", "logOR", "logRR", "logHR"] = (
-        "logRR"
-    )
+    effect_metric: EffectMetric = EffectMetric.logRR
     effect: float  # log effect if log scale, otherwise raw
     var: float  # variance of effect (SE^2)
 
 
 class StudyRecord(BaseModel):
+    model_config = _FROZEN
+
     study_id: str
     design: Optional[str] = None
     n_total: Optional[int] = None
@@ -19,6 +86,8 @@ class StudyRecord(BaseModel):
 
 
 class SearchDescriptor(BaseModel):
+    model_config = _FROZEN
+
     db: str
     platform: Optional[str] = None
     dates: Optional[str] = None
@@ -27,11 +96,15 @@ class SearchDescriptor(BaseModel):
 
 
 class ExclusionReason(BaseModel):
+    model_config = _FROZEN
+
     reason: str
     n: int
 
 
 class FlowCounts(BaseModel):
+    model_config = _FROZEN
+
     identified: Optional[int] = None
     deduplicated: Optional[int] = None
     screened: Optional[int] = None
@@ -41,7 +114,9 @@ class FlowCounts(BaseModel):
 
 
 class PICO(BaseModel):
-    framework: Literal["PICO", "PECO", "PS", "Other"] = "PICO"
+    model_config = _FROZEN
+
+    framework: PICOFramework = PICOFramework.PICO
     population: Optional[str] = None
     intervention: Optional[str] = None
     comparator: Optional[str] = None
@@ -61,9 +136,11 @@ class Manuscript(BaseModel):
 
 
 class Issue(BaseModel):
+    model_config = _FROZEN
+
     id: str
-    severity: Literal["low", "medium", "high"]
-    category: Literal["PICO", "PRISMA", "STATS", "DATA", "OTHER"]
+    severity: Severity
+    category: IssueCategory
     item: str
     evidence: Optional[Dict[str, Any]] = None
     recommendation: Optional[str] = None
@@ -73,7 +150,7 @@ class Issue(BaseModel):
 class MetaResult(BaseModel):
     outcome: str
     k: int
-    model: Literal["fixed", "random"]
+    model: PoolingModel
     pooled: float
     se: float
     ci_low: float
@@ -87,8 +164,10 @@ class MetaResult(BaseModel):
 class AnalysisMethod(BaseModel):
     """Information about the analysis method used by an agent."""
 
+    model_config = _FROZEN
+
     agent: str
-    method: Literal["rule-based", "llm-enhanced", "hybrid"]
+    method: AnalysisMethodType
     llm_model: Optional[str] = None
     llm_provider: Optional[str] = None
     fallback_reason: Optional[str] = None
@@ -97,6 +176,8 @@ class AnalysisMethod(BaseModel):
 class AnalysisMetadata(BaseModel):
     """Metadata about the analysis process and methods used."""
 
+    model_config = _FROZEN
+
     analysis_methods: List[AnalysisMethod]
     llm_available: bool
     total_llm_calls: int = 0
@@ -107,13 +188,12 @@ class AnalysisMetadata(BaseModel):
 class StreamingEvent(BaseModel):
     """Event for streaming orchestrator progress to clients."""
 
-    event_type: Literal[
-        "agent_start", "agent_complete", "progress", "complete", "error"
-    ]
+    event_type: StreamingEventType
     agent: Optional[str] = None
     message: str
     data: Optional[Dict[str, Any]] = None
     timestamp: Optional[str] = None
+    sequence: Optional[int] = None
 
 
 class ReviewResult(BaseModel):
@@ -1,6 +1,10 @@
-from typing import List, Optional
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+import asyncio
+import functools
 import logging
-from app.models.schemas import Manuscript, ReviewResult, Issue, MetaResult, AnalysisMethod, AnalysisMetadata
+from collections import Counter
+from dataclasses import dataclass
+from app.models.schemas import Manuscript, ReviewResult, Issue, MetaResult, PICO, AnalysisMethod, AnalysisMetadata
 from app.agents import pico_parser, prisma_checker, meta_analysis
 
 # Configure logging
@@ -17,8 +21,112 @@ except ImportError as e:
     print(f"LLM agents not available: {e}")
     LLM_AGENTS_AVAILABLE = False
 
-def get_llm_config() -> Optional[dict]:
-    """Get current LLM configuration for metadata tracking."""
+# Each agent helper returns its issues together with the AnalysisMethod
+# entries it produced, so results can be collected in a fixed order after
+# the agents run concurrently.
+AgentOutcome = Tuple[List[Issue], List[AnalysisMethod]]
+
+# Fixed-shape AnalysisMethod values reused across reviews. AnalysisMethod is
+# frozen, so sharing one instance is safe and skips validator overhead on
+# every review; the llm-enhanced templates get their dynamic model/provider
+# via model_copy at use.
+_AM_PICO_RULE = AnalysisMethod(agent="PICO-Parser", method="rule-based")
+_AM_PICO_FALLBACK = AnalysisMethod(
+    agent="PICO-Parser", method="rule-based", fallback_reason="LLM authentication failed"
+)
+_AM_PICO_DISABLED = AnalysisMethod(
+    agent="PICO-Parser", method="rule-based", fallback_reason="LLM disabled by parameter"
+)
+_AM_PICO_LLM = AnalysisMethod(agent="PICO-Parser", method="llm-enhanced")
+_AM_PRISMA_RULE = AnalysisMethod(agent="PRISMA-Checker", method="rule-based")
+_AM_ROB_FALLBACK = AnalysisMethod(
+    agent="Risk-of-Bias", method="rule-based", fallback_reason="LLM authentication failed"
+)
+_AM_ROB_DISABLED = AnalysisMethod(
+    agent="Risk-of-Bias", method="rule-based", fallback_reason="LLM disabled by parameter"
+)
+_AM_ROB_UNAVAILABLE = AnalysisMethod(
+    agent="Risk-of-Bias", method="rule-based", fallback_reason="LLM agents not available"
+)
+_AM_ROB_LLM = AnalysisMethod(agent="Risk-of-Bias", method="llm-enhanced")
+_AM_META_RULE = AnalysisMethod(agent="Meta-Analysis", method="rule-based")
+
+# Cap on concurrent LLM-bound agents, so bursty load can't fan out into
+# provider rate-limit (429) territory.
+MAX_CONCURRENT_LLM_CALLS = 8
+
+
+@dataclass
+class AgentNode:
+    """A review step with declared dependencies.
+
+    ``fn`` is awaited with the manuscript once every node named in ``deps``
+    has finished; ``llm_bound`` nodes additionally hold the shared LLM
+    semaphore while running.
+    """
+
+    name: str
+    fn: Callable[[Manuscript], Awaitable]
+    deps: Tuple[str, ...] = ()
+    llm_bound: bool = False
+
+
+class AgentDAG:
+    """Tiny scheduler for independent-but-orderable review agents.
+
+    Nodes start as soon as their dependencies complete, so today's fully
+    independent agents all run concurrently, and a future node like
+    "summary depends on PICO+RoB" is a one-line declaration instead of a
+    hand-written gather chain. A single semaphore throttles only the
+    LLM-bound nodes, keeping provider rate limiting in one place.
+    """
+
+    def __init__(self, nodes: List[AgentNode], max_concurrent_llm_calls: int = MAX_CONCURRENT_LLM_CALLS):
+        self._nodes = {node.name: node for node in nodes}
+        self._max_concurrent_llm_calls = max_concurrent_llm_calls
+
+    async def stream(self, manuscript: Manuscript):
+        """Yield ``(name, result)`` pairs as nodes complete."""
+        llm_semaphore = asyncio.Semaphore(self._max_concurrent_llm_calls)
+        done = {name: asyncio.Event() for name in self._nodes}
+        finished: "asyncio.Queue[Tuple[str, object]]" = asyncio.Queue()
+
+        async def run_node(node: AgentNode) -> None:
+            for dep in node.deps:
+                await done[dep].wait()
+            try:
+                if node.llm_bound:
+                    async with llm_semaphore:
+                        result = await node.fn(manuscript)
+                else:
+                    result = await node.fn(manuscript)
+            except BaseException as exc:
+                finished.put_nowait((node.name, exc))
+                return
+            done[node.name].set()
+            finished.put_nowait((node.name, result))
+
+        tasks = [
+            asyncio.create_task(run_node(node)) for node in self._nodes.values()
+        ]
+        try:
+            for _ in range(len(tasks)):
+                name, result = await finished.get()
+                if isinstance(result, BaseException):
+                    raise result
+                yield name, result
+        finally:
+            # A failed (or abandoned) stream cancels nodes still waiting on
+            # the failed dependency instead of leaving them parked forever.
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def run(self, manuscript: Manuscript) -> Dict[str, object]:
+        return {name: result async for name, result in self.stream(manuscript)}
+
+@functools.lru_cache(maxsize=1)
+def _get_llm_config_cached() -> Optional[dict]:
     try:
         if LLM_AGENTS_AVAILABLE:
             env = get_llm_environment()
@@ -31,207 +139,348 @@ def get_llm_config() -> Optional[dict]:
         pass
     return None
 
-def simple_review(manuscript: Manuscript) -> ReviewResult:
+def get_llm_config() -> Optional[dict]:
+    """Get current LLM configuration for metadata tracking.
+
+    The underlying lookup walks get_llm_environment().validate_setup(),
+    which re-reads env vars on every call; configuration only changes at
+    deploy time, so the result is memoized for the process lifetime.
+    """
+    return _get_llm_config_cached()
+
+def invalidate_llm_config() -> None:
+    """Drop the memoized LLM config (for tests that mutate the environment)."""
+    _get_llm_config_cached.cache_clear()
+
+def _simple_agent_nodes(llm_model: Optional[str], llm_provider: Optional[str]) -> List[AgentNode]:
+    """Build the four simple-review agent nodes with the usual fallbacks."""
+
+    async def run_pico(manuscript: Manuscript) -> AgentOutcome:
+        logger.info("🎯 Starting PICO Analysis...")
+        if LLM_AGENTS_AVAILABLE:
+            try:
+                logger.info("🤖 Attempting LLM-enhanced PICO parsing...")
+                enhanced_pico = EnhancedPICOParser(use_llm=True, fallback_to_rules=True)
+                pico_issues = await asyncio.to_thread(enhanced_pico.run, manuscript)
+                logger.info("✅ LLM-enhanced PICO parsing completed - found %d issues", len(pico_issues))
+                return pico_issues, [_AM_PICO_LLM.model_copy(
+                    update={"llm_model": llm_model, "llm_provider": llm_provider}
+                )]
+            except Exception as e:
+                logger.warning("⚠️ Enhanced PICO parser failed, falling back to rule-based: %s", e)
+                pico_issues = await asyncio.to_thread(pico_parser.run, manuscript)
+                logger.info("✅ Rule-based PICO parsing completed - found %d issues", len(pico_issues))
+                return pico_issues, [_AM_PICO_FALLBACK]
+        logger.info("📋 Using rule-based PICO parsing (LLM agents not available)...")
+        pico_issues = await asyncio.to_thread(pico_parser.run, manuscript)
+        logger.info("✅ Rule-based PICO parsing completed - found %d issues", len(pico_issues))
+        return pico_issues, [_AM_PICO_RULE]
+
+    async def run_prisma(manuscript: Manuscript) -> AgentOutcome:
+        logger.info("📊 Starting PRISMA validation...")
+        prisma_issues = await asyncio.to_thread(prisma_checker.run, manuscript)
+        logger.info("✅ PRISMA validation completed - found %d issues", len(prisma_issues))
+        return prisma_issues, [_AM_PRISMA_RULE]
+
+    async def run_rob(manuscript: Manuscript) -> AgentOutcome:
+        logger.info("⚖️ Starting Risk of Bias assessment...")
+        if LLM_AGENTS_AVAILABLE:
+            try:
+                logger.info("🤖 Attempting LLM-enhanced Risk of Bias assessment...")
+                rob_assessor = RoBAssessor(use_llm=True)
+                rob_issues = await asyncio.to_thread(rob_assessor.run, manuscript)
+                logger.info("✅ LLM-enhanced Risk of Bias assessment completed - found %d issues", len(rob_issues))
+                return rob_issues, [_AM_ROB_LLM.model_copy(
+                    update={"llm_model": llm_model, "llm_provider": llm_provider}
+                )]
+            except Exception as e:
+                logger.warning("⚠️ Risk of Bias assessor failed: %s", e)
+                logger.info("📋 No fallback available for Risk of Bias - skipping")
+                return [], [_AM_ROB_FALLBACK]
+        logger.info("📋 Risk of Bias assessment skipped (LLM agents not available)")
+        return [], []
+
+    async def run_meta(manuscript: Manuscript) -> Tuple[List[MetaResult], List[AnalysisMethod]]:
+        logger.info("📈 Starting Meta-analysis...")
+        meta_results = await asyncio.to_thread(meta_analysis.run, manuscript)
+        logger.info("✅ Meta-analysis completed - generated %d results", len(meta_results))
+        return meta_results, [_AM_META_RULE]
+
+    return [
+        AgentNode("pico", run_pico, llm_bound=True),
+        AgentNode("prisma", run_prisma),
+        AgentNode("rob", run_rob, llm_bound=True),
+        AgentNode("meta", run_meta),
+    ]
+
+def _fused_pico_rob_node(llm_model: Optional[str], llm_provider: Optional[str]) -> AgentNode:
+    """Build a node that answers PICO extraction and per-study RoB in one LLM call.
+
+    Both agents embed largely the same manuscript context, so fusing their
+    prompts moves the shared tokens once and pays one round-trip instead of
+    1 + n_studies. The combined JSON response is demultiplexed back into each
+    agent's existing validation/conversion logic; any failure falls back to
+    the separate PICO and RoB nodes.
+    """
+
+    async def run_fused(manuscript: Manuscript) -> Tuple[List[Issue], List[AnalysisMethod], List[Issue], List[AnalysisMethod]]:
+        async def run_separately() -> Tuple[List[Issue], List[AnalysisMethod], List[Issue], List[AnalysisMethod]]:
+            base = {node.name: node for node in _simple_agent_nodes(llm_model, llm_provider)}
+            pico_issues, pico_methods = await base["pico"].fn(manuscript)
+            rob_issues, rob_methods = await base["rob"].fn(manuscript)
+            return pico_issues, pico_methods, rob_issues, rob_methods
+
+        if not LLM_AGENTS_AVAILABLE:
+            return await run_separately()
+        try:
+            from app.services.llm_client import LLMClient, get_llm_client
+            from app.services.prompt_templates import get_prompt
+
+            logger.info("🎯⚖️ Starting fused PICO + RoB analysis (single LLM call)...")
+            parser = EnhancedPICOParser(use_llm=False)
+            assessor = RoBAssessor(use_llm=False)
+            manuscript_text = parser._extract_available_text(manuscript)
+            studies_text = "\n".join(
+                f"- {study.study_id}: design={study.design or 'Not specified'}, "
+                f"n={study.n_total or 'Not specified'}, outcomes={len(study.outcomes)}"
+                for study in manuscript.included_studies
+            ) or "No included studies listed"
+
+            prompt = get_prompt("combined_pico_rob")
+            response = await get_llm_client().generate_completion(
+                prompt=prompt.format(
+                    manuscript_text=manuscript_text, studies_text=studies_text
+                ),
+                system_prompt=prompt.system_prompt,
+            )
+            combined = LLMClient.parse_json(response)
+
+            pico_data = combined.get("pico") or {}
+            pico = PICO(
+                framework="PICO",
+                population=pico_data.get("population"),
+                intervention=pico_data.get("intervention"),
+                comparator=pico_data.get("comparator"),
+                outcomes=pico_data.get("outcomes") or [],
+            )
+            pico_issues = parser._validate_existing_pico(pico)
+
+            rob_issues: List[Issue] = []
+            rob_data = combined.get("rob") or {}
+            for study in manuscript.included_studies:
+                assessment = rob_data.get(study.study_id)
+                if assessment:
+                    rob_issues.extend(
+                        assessor._convert_rob_to_issues(assessment, study.study_id)
+                    )
+            logger.info(
+                "✅ Fused PICO + RoB analysis completed - found %d PICO and %d RoB issues",
+                len(pico_issues),
+                len(rob_issues),
+            )
+            update = {"llm_model": llm_model, "llm_provider": llm_provider}
+            return (
+                pico_issues,
+                [_AM_PICO_LLM.model_copy(update=update)],
+                rob_issues,
+                [_AM_ROB_LLM.model_copy(update=update)],
+            )
+        except Exception as e:
+            logger.warning(
+                "⚠️ Fused PICO + RoB analysis failed, falling back to separate agents: %s", e
+            )
+            return await run_separately()
+
+    return AgentNode("pico_rob", run_fused, llm_bound=True)
+
+def simple_review(manuscript: Manuscript, fuse_prompts: bool = False) -> ReviewResult:
+    """Synchronous wrapper around :func:`simple_review_async`."""
+    return asyncio.run(simple_review_async(manuscript, fuse_prompts=fuse_prompts))
+
+async def simple_review_async(manuscript: Manuscript, fuse_prompts: bool = False) -> ReviewResult:
     """
     Enhanced review workflow with LLM-powered agents when available.
     Falls back to rule-based analysis if LLM integration fails.
+
+    The four agents are independent (issues accumulate per agent, meta-analysis
+    only reads the manuscript), so they run concurrently: the LLM-backed ones
+    spend most of their time waiting on remote HTTP calls, and the rule-based
+    ones are cheap, so wall-clock drops to roughly the slowest agent instead of
+    the sum. Each helper keeps its own try/except fallback, so one agent
+    failing never cancels the others. Results are collected in the original
+    PICO → PRISMA → RoB → Meta order to keep output stable.
     """
-    logger.info(f"🔍 Starting systematic review analysis for manuscript: {manuscript.manuscript_id}")
-    logger.info(f"📄 Title: {manuscript.title[:100] if manuscript.title else 'No title'}...")
-    
-    issues: List[Issue] = []
-    analysis_methods: List[AnalysisMethod] = []
+    logger.info("🔍 Starting systematic review analysis for manuscript: %s", manuscript.manuscript_id)
+    logger.info("📄 Title: %.100s...", manuscript.title or "No title")
+
     llm_config = get_llm_config()
-    
+    llm_available = bool(llm_config and llm_config["available"])
+    llm_model = llm_config["model"] if llm_available else None
+    llm_provider = llm_config["provider"] if llm_available else None
+
     # Log LLM configuration status
     if llm_config:
-        logger.info(f"⚙️ LLM Config - Available: {llm_config.get('available', False)}, Provider: {llm_config.get('provider', 'None')}, Model: {llm_config.get('model', 'None')}")
+        logger.info(
+            "⚙️ LLM Config - Available: %s, Provider: %s, Model: %s",
+            llm_config.get("available", False),
+            llm_config.get("provider", "None"),
+            llm_config.get("model", "None"),
+        )
     else:
         logger.info("❌ LLM Config - Not available")
-    
-    # PICO Analysis - Enhanced with LLM when available
-    logger.info("🎯 Starting PICO Analysis...")
-    if LLM_AGENTS_AVAILABLE:
-        try:
-            logger.info("🤖 Attempting LLM-enhanced PICO parsing...")
-            enhanced_pico = EnhancedPICOParser(use_llm=True, fallback_to_rules=True)
-            pico_issues = enhanced_pico.run(manuscript)
-            issues += pico_issues
-            logger.info(f"✅ LLM-enhanced PICO parsing completed - found {len(pico_issues)} issues")
-            analysis_methods.append(AnalysisMethod(
-                agent="PICO-Parser",
-                method="llm-enhanced",
-                llm_model=llm_config["model"] if llm_config and llm_config["available"] else None,
-                llm_provider=llm_config["provider"] if llm_config and llm_config["available"] else None
-            ))
-        except Exception as e:
-            logger.warning(f"⚠️ Enhanced PICO parser failed, falling back to rule-based: {e}")
-            pico_issues = pico_parser.run(manuscript)
-            issues += pico_issues
-            logger.info(f"✅ Rule-based PICO parsing completed - found {len(pico_issues)} issues")
-            analysis_methods.append(AnalysisMethod(
-                agent="PICO-Parser",
-                method="rule-based",
-                fallback_reason="LLM authentication failed"
-            ))
+
+    nodes = {node.name: node for node in _simple_agent_nodes(llm_model, llm_provider)}
+    if fuse_prompts:
+        dag_nodes = [
+            _fused_pico_rob_node(llm_model, llm_provider),
+            nodes["prisma"],
+            nodes["meta"],
+        ]
     else:
-        logger.info("📋 Using rule-based PICO parsing (LLM agents not available)...")
-        pico_issues = pico_parser.run(manuscript)
-        issues += pico_issues
-        logger.info(f"✅ Rule-based PICO parsing completed - found {len(pico_issues)} issues")
-        analysis_methods.append(AnalysisMethod(
-            agent="PICO-Parser",
-            method="rule-based"
-        ))
-    
-    # PRISMA Validation - Keep existing rule-based approach
-    logger.info("📊 Starting PRISMA validation...")
-    prisma_issues = prisma_checker.run(manuscript)
-    issues += prisma_issues
-    logger.info(f"✅ PRISMA validation completed - found {len(prisma_issues)} issues")
-    analysis_methods.append(AnalysisMethod(
-        agent="PRISMA-Checker",
-        method="rule-based"
-    ))
-    
-    # Risk of Bias Assessment - New LLM-enhanced agent
-    logger.info("⚖️ Starting Risk of Bias assessment...")
-    if LLM_AGENTS_AVAILABLE:
-        try:
-            logger.info("🤖 Attempting LLM-enhanced Risk of Bias assessment...")
-            rob_assessor = RoBAssessor(use_llm=True)
-            rob_issues = rob_assessor.run(manuscript)
-            issues += rob_issues
-            logger.info(f"✅ LLM-enhanced Risk of Bias assessment completed - found {len(rob_issues)} issues")
-            analysis_methods.append(AnalysisMethod(
-                agent="Risk-of-Bias",
-                method="llm-enhanced",
-                llm_model=llm_config["model"] if llm_config and llm_config["available"] else None,
-                llm_provider=llm_config["provider"] if llm_config and llm_config["available"] else None
-            ))
-        except Exception as e:
-            logger.warning(f"⚠️ Risk of Bias assessor failed: {e}")
-            logger.info("📋 No fallback available for Risk of Bias - skipping")
-            analysis_methods.append(AnalysisMethod(
-                agent="Risk-of-Bias",
-                method="rule-based",
-                fallback_reason="LLM authentication failed"
-            ))
+        dag_nodes = list(nodes.values())
+    results = await AgentDAG(dag_nodes).run(manuscript)
+    if fuse_prompts:
+        pico_issues, pico_methods, rob_issues, rob_methods = results["pico_rob"]
     else:
-        logger.info("📋 Risk of Bias assessment skipped (LLM agents not available)")
-    
-    # Meta-Analysis - Keep existing approach
-    logger.info("📈 Starting Meta-analysis...")
-    meta_results = meta_analysis.run(manuscript)
-    logger.info(f"✅ Meta-analysis completed - generated {len(meta_results)} results")
-    analysis_methods.append(AnalysisMethod(
-        agent="Meta-Analysis",
-        method="rule-based"
-    ))
-    
+        pico_issues, pico_methods = results["pico"]
+        rob_issues, rob_methods = results["rob"]
+    prisma_issues, prisma_methods = results["prisma"]
+    meta_results, meta_methods = results["meta"]
+
+    issues: List[Issue] = pico_issues + prisma_issues + rob_issues
+    analysis_methods: List[AnalysisMethod] = (
+        pico_methods + prisma_methods + rob_methods + meta_methods
+    )
+
     # Create analysis metadata
     metadata = AnalysisMetadata(
         analysis_methods=analysis_methods,
-        llm_available=llm_config["available"] if llm_config else False,
-        total_llm_calls=len([m for m in analysis_methods if m.method == "llm-enhanced"])
+        llm_available=llm_available,
+        total_llm_calls=sum(1 for m in analysis_methods if m.method == "llm-enhanced")
     )
-    
-    # Final summary
-    total_issues = len(issues)
-    severity_counts = {}
-    for issue in issues:
-        sev = issue.severity
-        severity_counts[sev] = severity_counts.get(sev, 0) + 1
-    
-    logger.info(f"🎉 Analysis complete! Total issues: {total_issues}")
-    for severity in ['high', 'medium', 'low']:
-        count = severity_counts.get(severity, 0)
-        if count > 0:
-            logger.info(f"   {severity.upper()}: {count} issues")
-    
-    logger.info(f"🤖 LLM calls made: {metadata.total_llm_calls}")
-    
+
+    # Final summary - skipped wholesale (including the Counter pass) when
+    # INFO logging is disabled.
+    if logger.isEnabledFor(logging.INFO):
+        severity_counts = Counter(issue.severity for issue in issues)
+        logger.info("🎉 Analysis complete! Total issues: %d", len(issues))
+        for severity in ['high', 'medium', 'low']:
+            count = severity_counts.get(severity, 0)
+            if count > 0:
+                logger.info("   %s: %d issues", severity.upper(), count)
+
+    logger.info("🤖 LLM calls made: %d", metadata.total_llm_calls)
+
     return ReviewResult(issues=issues, meta=meta_results, analysis_metadata=metadata)
 
+async def simple_review_stream(manuscript: Manuscript):
+    """Stream per-agent results as each agent completes.
+
+    Yields ``(name, chunk)`` pairs in completion order - ``pico``, ``prisma``
+    and ``rob`` carry their issue lists, ``meta`` the meta-analysis results -
+    followed by a final ``("metadata", AnalysisMetadata)``. Callers can start
+    serializing the fastest agent's output immediately instead of waiting for
+    the slowest, which is what :func:`simple_review_async` forces by returning
+    one fully materialized ReviewResult.
+    """
+    llm_config = get_llm_config()
+    llm_available = bool(llm_config and llm_config["available"])
+    llm_model = llm_config["model"] if llm_available else None
+    llm_provider = llm_config["provider"] if llm_available else None
+
+    outcomes: Dict[str, Tuple] = {}
+    dag = AgentDAG(_simple_agent_nodes(llm_model, llm_provider))
+    async for name, result in dag.stream(manuscript):
+        outcomes[name] = result
+        chunk, _methods = result
+        yield name, chunk
+
+    # Methods are reported in the canonical agent order regardless of which
+    # agent happened to finish first.
+    analysis_methods: List[AnalysisMethod] = [
+        method
+        for name in ("pico", "prisma", "rob", "meta")
+        for method in outcomes[name][1]
+    ]
+    yield "metadata", AnalysisMetadata(
+        analysis_methods=analysis_methods,
+        llm_available=llm_available,
+        total_llm_calls=sum(1 for m in analysis_methods if m.method == "llm-enhanced")
+    )
+
 def enhanced_review(manuscript: Manuscript, use_llm: bool = True) -> ReviewResult:
+    """Synchronous wrapper around :func:`enhanced_review_async`."""
+    return asyncio.run(enhanced_review_async(manuscript, use_llm=use_llm))
+
+async def enhanced_review_async(manuscript: Manuscript, use_llm: bool = True) -> ReviewResult:
     """
     Fully enhanced review workflow with explicit LLM control and graceful fallbacks.
+
+    Agents run concurrently, same as :func:`simple_review_async`.
     """
-    issues: List[Issue] = []
-    analysis_methods: List[AnalysisMethod] = []
     llm_config = get_llm_config()
-    
-    # Enhanced PICO Analysis with graceful fallback
-    if LLM_AGENTS_AVAILABLE and use_llm:
-        try:
-            enhanced_pico = EnhancedPICOParser(use_llm=True, fallback_to_rules=True)
-            issues += enhanced_pico.run(manuscript)
-            analysis_methods.append(AnalysisMethod(
-                agent="PICO-Parser",
-                method="llm-enhanced",
-                llm_model=llm_config["model"] if llm_config and llm_config["available"] else None,
-                llm_provider=llm_config["provider"] if llm_config and llm_config["available"] else None
-            ))
-        except Exception as e:
-            print(f"Enhanced PICO parser failed in enhanced_review, falling back to rule-based: {e}")
-            issues += pico_parser.run(manuscript)
-            analysis_methods.append(AnalysisMethod(
-                agent="PICO-Parser",
-                method="rule-based",
-                fallback_reason="LLM authentication failed"
-            ))
-    else:
-        issues += pico_parser.run(manuscript)
-        analysis_methods.append(AnalysisMethod(
-            agent="PICO-Parser",
-            method="rule-based",
-            fallback_reason="LLM disabled by parameter" if not use_llm else None
-        ))
-    
-    # PRISMA Validation
-    issues += prisma_checker.run(manuscript)
-    analysis_methods.append(AnalysisMethod(
-        agent="PRISMA-Checker",
-        method="rule-based"
-    ))
-    
-    # Risk of Bias Assessment with graceful fallback
-    if LLM_AGENTS_AVAILABLE and use_llm:
-        try:
-            rob_assessor = RoBAssessor(use_llm=True)
-            issues += rob_assessor.run(manuscript)
-            analysis_methods.append(AnalysisMethod(
-                agent="Risk-of-Bias",
-                method="llm-enhanced",
-                llm_model=llm_config["model"] if llm_config and llm_config["available"] else None,
-                llm_provider=llm_config["provider"] if llm_config and llm_config["available"] else None
-            ))
-        except Exception as e:
-            print(f"Risk of Bias assessor failed in enhanced_review: {e}")
-            analysis_methods.append(AnalysisMethod(
-                agent="Risk-of-Bias",
-                method="rule-based",
-                fallback_reason="LLM authentication failed"
-            ))
-    else:
-        analysis_methods.append(AnalysisMethod(
-            agent="Risk-of-Bias",
-            method="rule-based",
-            fallback_reason="LLM disabled by parameter" if not use_llm else "LLM agents not available"
-        ))
-    
-    # Meta-Analysis
-    meta: List[MetaResult] = meta_analysis.run(manuscript)
-    analysis_methods.append(AnalysisMethod(
-        agent="Meta-Analysis",
-        method="rule-based"
-    ))
-    
+    llm_available = bool(llm_config and llm_config["available"])
+    llm_model = llm_config["model"] if llm_available else None
+    llm_provider = llm_config["provider"] if llm_available else None
+
+    async def run_pico(manuscript: Manuscript) -> AgentOutcome:
+        if LLM_AGENTS_AVAILABLE and use_llm:
+            try:
+                enhanced_pico = EnhancedPICOParser(use_llm=True, fallback_to_rules=True)
+                pico_issues = await asyncio.to_thread(enhanced_pico.run, manuscript)
+                return pico_issues, [_AM_PICO_LLM.model_copy(
+                    update={"llm_model": llm_model, "llm_provider": llm_provider}
+                )]
+            except Exception as e:
+                logger.warning("Enhanced PICO parser failed in enhanced_review, falling back to rule-based: %s", e)
+                pico_issues = await asyncio.to_thread(pico_parser.run, manuscript)
+                return pico_issues, [_AM_PICO_FALLBACK]
+        pico_issues = await asyncio.to_thread(pico_parser.run, manuscript)
+        return pico_issues, [_AM_PICO_DISABLED if not use_llm else _AM_PICO_RULE]
+
+    async def run_prisma(manuscript: Manuscript) -> AgentOutcome:
+        prisma_issues = await asyncio.to_thread(prisma_checker.run, manuscript)
+        return prisma_issues, [_AM_PRISMA_RULE]
+
+    async def run_rob(manuscript: Manuscript) -> AgentOutcome:
+        if LLM_AGENTS_AVAILABLE and use_llm:
+            try:
+                rob_assessor = RoBAssessor(use_llm=True)
+                rob_issues = await asyncio.to_thread(rob_assessor.run, manuscript)
+                return rob_issues, [_AM_ROB_LLM.model_copy(
+                    update={"llm_model": llm_model, "llm_provider": llm_provider}
+                )]
+            except Exception as e:
+                logger.warning("Risk of Bias assessor failed in enhanced_review: %s", e)
+                return [], [_AM_ROB_FALLBACK]
+        return [], [_AM_ROB_DISABLED if not use_llm else _AM_ROB_UNAVAILABLE]
+
+    async def run_meta(manuscript: Manuscript) -> Tuple[List[MetaResult], List[AnalysisMethod]]:
+        meta_results = await asyncio.to_thread(meta_analysis.run, manuscript)
+        return meta_results, [_AM_META_RULE]
+
+    dag = AgentDAG([
+        AgentNode("pico", run_pico, llm_bound=True),
+        AgentNode("prisma", run_prisma),
+        AgentNode("rob", run_rob, llm_bound=True),
+        AgentNode("meta", run_meta),
+    ])
+    results = await dag.run(manuscript)
+    pico_issues, pico_methods = results["pico"]
+    prisma_issues, prisma_methods = results["prisma"]
+    rob_issues, rob_methods = results["rob"]
+    meta, meta_methods = results["meta"]
+
+    issues: List[Issue] = pico_issues + prisma_issues + rob_issues
+    analysis_methods: List[AnalysisMethod] = (
+        pico_methods + prisma_methods + rob_methods + meta_methods
+    )
+
     # Create analysis metadata
     metadata = AnalysisMetadata(
         analysis_methods=analysis_methods,
-        llm_available=llm_config["available"] if llm_config else False,
-        total_llm_calls=len([m for m in analysis_methods if m.method == "llm-enhanced"])
+        llm_available=llm_available,
+        total_llm_calls=sum(1 for m in analysis_methods if m.method == "llm-enhanced")
     )
-    
+
     return ReviewResult(issues=issues, meta=meta, analysis_metadata=metadata)
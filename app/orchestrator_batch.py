@@ -0,0 +1,225 @@
+"""
+Offline batch review via the OpenAI Batch API.
+
+Bulk audit runs (re-evaluating a corpus of manuscripts) have no real-time
+latency requirement, so their PICO and RoB prompts are packaged into a
+single Batch API submission instead of per-manuscript live calls - about
+half the per-token cost and much higher throughput limits. PRISMA and
+meta-analysis stay local and rule-based. Real-time paths should keep using
+:func:`app.orchestrator.simple_review`.
+"""
+
+from typing import Dict, List, Optional, Tuple
+import asyncio
+import json
+import logging
+
+from app.models.schemas import (
+    Manuscript,
+    ReviewResult,
+    Issue,
+    PICO,
+    AnalysisMethod,
+    AnalysisMetadata,
+)
+from app.agents import meta_analysis
+from app.agents.pico_parser_enhanced import EnhancedPICOParser
+from app.agents.prisma_checker import EnhancedPRISMAChecker
+from app.agents.rob_assessor import RoBAssessor
+from app.orchestrator import get_llm_config, simple_review_async
+from app.services.llm_client import BatchRequest, get_llm_client
+from app.services.prompt_templates import get_prompt
+
+logger = logging.getLogger("orchestrator_batch")
+
+# Batch jobs complete within 24h; poll coarsely - the point is throughput,
+# not latency.
+DEFAULT_POLL_INTERVAL_S = 60.0
+
+# Terminal batch states per the Batch API lifecycle.
+_TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+
+def _collect_batch_requests(manuscripts: List[Manuscript]) -> List[BatchRequest]:
+    """Build one BatchRequest per LLM prompt across all manuscripts.
+
+    custom_ids encode the routing: ``<manuscript_id>|pico`` for PICO
+    extraction and ``<manuscript_id>|rob|<study_id>`` per study assessment.
+    """
+    pico_parser = EnhancedPICOParser(use_llm=False)
+    rob_assessor = RoBAssessor(use_llm=False)
+    pico_prompt = get_prompt("pico_extraction")
+    rob_prompt = get_prompt("rob_assessment")
+
+    requests: List[BatchRequest] = []
+    for manuscript in manuscripts:
+        manuscript_text = pico_parser._extract_available_text(manuscript)
+        requests.append(BatchRequest(
+            custom_id=f"{manuscript.manuscript_id}|pico",
+            prompt=pico_prompt.format(manuscript_text=manuscript_text),
+            system_prompt=pico_prompt.system_prompt,
+        ))
+
+        for study in manuscript.included_studies:
+            is_rct = study.design and "rct" in study.design.lower()
+            domains = (
+                rob_assessor.rob2_domains if is_rct else rob_assessor.robins_domains
+            )
+            study_text = f"""
+            Study ID: {study.study_id}
+            Design: {study.design or 'Not specified'}
+            Sample Size: {study.n_total or 'Not specified'}
+            Outcomes: {len(study.outcomes)} outcomes reported
+            """
+            requests.append(BatchRequest(
+                custom_id=f"{manuscript.manuscript_id}|rob|{study.study_id}",
+                prompt=rob_prompt.format(
+                    study_design=study.design or "Not specified",
+                    study_text=study_text,
+                    assessment_tool="RoB 2" if is_rct else "ROBINS-I",
+                    domains="\n".join(
+                        [f"- {name}: {desc}" for name, desc in domains.items()]
+                    ),
+                ),
+                system_prompt=rob_prompt.system_prompt,
+            ))
+    return requests
+
+
+def _pico_issues_from_response(
+    parser: EnhancedPICOParser, response: Optional[str]
+) -> List[Issue]:
+    """Route a batched PICO extraction back through the parser's validation."""
+    if response is None:
+        return []
+    try:
+        pico_data = json.loads(response)
+        pico = PICO(
+            framework="PICO",
+            population=pico_data["population"],
+            intervention=pico_data["intervention"],
+            comparator=pico_data["comparator"],
+            outcomes=pico_data["outcomes"] or [],
+        )
+    except (json.JSONDecodeError, KeyError, TypeError) as e:
+        logger.warning("Failed to parse batched PICO response: %s", e)
+        return []
+    return parser._validate_existing_pico(pico)
+
+
+def _rob_issues_from_responses(
+    assessor: RoBAssessor,
+    manuscript: Manuscript,
+    responses: Dict[str, str],
+) -> List[Issue]:
+    """Route batched per-study RoB responses through the assessor's parsing."""
+    issues: List[Issue] = []
+    for study in manuscript.included_studies:
+        response = responses.get(f"{manuscript.manuscript_id}|rob|{study.study_id}")
+        if response is None:
+            continue
+        try:
+            assessment = assessor._parse_rob_response(response, study.study_id)
+            issues.extend(assessor._convert_rob_to_issues(assessment, study.study_id))
+        except Exception as e:
+            logger.warning(
+                "Failed to parse batched RoB response for %s: %s", study.study_id, e
+            )
+    return issues
+
+
+async def wait_for_batch(
+    batch_id: str, poll_interval_s: float = DEFAULT_POLL_INTERVAL_S
+) -> str:
+    """Poll until the batch reaches a terminal status; returns that status."""
+    client = get_llm_client()
+    while True:
+        batch = await client.poll_batch(batch_id)
+        if batch.status in _TERMINAL_STATUSES:
+            return batch.status
+        logger.info("Batch %s still %s; polling again", batch_id, batch.status)
+        await asyncio.sleep(poll_interval_s)
+
+
+async def batch_review(
+    manuscripts: List[Manuscript],
+    poll_interval_s: float = DEFAULT_POLL_INTERVAL_S,
+) -> List[ReviewResult]:
+    """Review a corpus of manuscripts through one Batch API submission.
+
+    Submits all PICO/RoB prompts as a single batch, waits for completion,
+    then demultiplexes responses by custom_id back into each agent's
+    existing parsing logic. PRISMA and meta-analysis run locally. If the
+    batch does not complete, falls back to per-manuscript
+    :func:`simple_review_async`.
+    """
+    client = get_llm_client()
+    requests = _collect_batch_requests(manuscripts)
+    logger.info(
+        "Submitting %d batched prompts for %d manuscripts",
+        len(requests),
+        len(manuscripts),
+    )
+    batch_id = await client.submit_batch(requests)
+
+    status = await wait_for_batch(batch_id, poll_interval_s)
+    if status != "completed":
+        logger.warning(
+            "Batch %s ended %s; falling back to live review", batch_id, status
+        )
+        return [await simple_review_async(manuscript) for manuscript in manuscripts]
+
+    responses = await client.retrieve_batch_results(batch_id)
+    llm_config = get_llm_config()
+    llm_available = bool(llm_config and llm_config["available"])
+    llm_model = llm_config["model"] if llm_available else None
+    llm_provider = llm_config["provider"] if llm_available else None
+
+    pico_parser = EnhancedPICOParser(use_llm=False)
+    prisma_checker = EnhancedPRISMAChecker(use_llm=False)
+    rob_assessor = RoBAssessor(use_llm=False)
+
+    results: List[ReviewResult] = []
+    for manuscript in manuscripts:
+        issues: List[Issue] = []
+        analysis_methods: List[AnalysisMethod] = []
+
+        issues += _pico_issues_from_response(
+            pico_parser, responses.get(f"{manuscript.manuscript_id}|pico")
+        )
+        analysis_methods.append(AnalysisMethod(
+            agent="PICO-Parser",
+            method="llm-enhanced",
+            llm_model=llm_model,
+            llm_provider=llm_provider,
+        ))
+
+        issues += prisma_checker.run(manuscript)
+        analysis_methods.append(AnalysisMethod(
+            agent="PRISMA-Checker",
+            method="rule-based",
+        ))
+
+        issues += _rob_issues_from_responses(rob_assessor, manuscript, responses)
+        analysis_methods.append(AnalysisMethod(
+            agent="Risk-of-Bias",
+            method="llm-enhanced",
+            llm_model=llm_model,
+            llm_provider=llm_provider,
+        ))
+
+        meta_results = meta_analysis.run(manuscript)
+        analysis_methods.append(AnalysisMethod(
+            agent="Meta-Analysis",
+            method="rule-based",
+        ))
+
+        metadata = AnalysisMetadata(
+            analysis_methods=analysis_methods,
+            llm_available=llm_available,
+            total_llm_calls=1 + len(manuscript.included_studies),
+        )
+        results.append(
+            ReviewResult(issues=issues, meta=meta_results, analysis_metadata=metadata)
+        )
+    return results
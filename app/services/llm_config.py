@@ -5,14 +5,27 @@ Handles API keys, model selection, retry logic, and cost optimization
 for systematic review analysis workflows.
 """
 
+import functools
+import logging
 import os
+import re
+import sys
+import time
 from typing import Dict, Any, Optional
 from dataclasses import dataclass, field
 from pathlib import Path
-import json
 
 
-@dataclass
+logger = logging.getLogger("llm_config")
+
+
+# Interned provider names: dict lookups keyed on these hit CPython's
+# identity fast path instead of a character compare.
+_OPENROUTER = sys.intern("openrouter")
+_OLLAMA = sys.intern("ollama")
+
+
+@dataclass(slots=True, frozen=True)
 class ModelConfig:
     """Configuration for a specific LLM model."""
 
@@ -24,7 +37,7 @@ class ModelConfig:
     recommended_use: str = "general"
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMSettings:
     """Global LLM settings and preferences."""
 
@@ -35,21 +48,46 @@ class LLMSettings:
     enable_caching: bool = True
     cost_limit_per_day: float = 10.0  # USD
     log_api_calls: bool = True
-    models: Dict[str, ModelConfig] = field(default_factory=dict)
-
-    def __post_init__(self):
-        """Initialize default model configurations."""
-        if not self.models:
-            self.models = get_default_models()
-
-
+    # Slot-backed lazy caches; cached_property needs a __dict__, which
+    # slots classes do not have.
+    _models_cache: Optional[Dict[str, ModelConfig]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _provider_index_cache: Optional[Dict[str, list]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def models(self) -> Dict[str, ModelConfig]:
+        """Default model configurations, built on first access."""
+        if self._models_cache is None:
+            self._models_cache = get_default_models()
+        return self._models_cache
+
+    @property
+    def _provider_index(self) -> Dict[str, list]:
+        """provider -> model names, precomputed so validation walks
+        providers instead of re-deduplicating per model."""
+        if self._provider_index_cache is None:
+            index: Dict[str, list] = {}
+            for model_name, model_config in self.models.items():
+                index.setdefault(model_config.provider, []).append(model_name)
+            self._provider_index_cache = index
+        return self._provider_index_cache
+
+
+@functools.lru_cache(maxsize=1)
 def get_default_models() -> Dict[str, ModelConfig]:
-    """Get default model configurations optimized for systematic review tasks."""
+    """Get default model configurations optimized for systematic review tasks.
+
+    Built once and shared; the ModelConfig entries are frozen, so handing
+    every caller the same dict is safe.
+    """
     return {
         # OpenRouter Models (Primary provider)
         "claude-3.5-haiku-openrouter": ModelConfig(
             name="anthropic/claude-3.5-haiku",
-            provider="openrouter",
+            provider=_OPENROUTER,
             max_tokens=4000,
             temperature=0.1,
             cost_per_1k_tokens=0.0001,
@@ -57,7 +95,7 @@ def get_default_models() -> Dict[str, ModelConfig]:
         ),
         "claude-3.5-sonnet-openrouter": ModelConfig(
             name="anthropic/claude-3.5-sonnet",
-            provider="openrouter",
+            provider=_OPENROUTER,
             max_tokens=4000,
             temperature=0.1,
             cost_per_1k_tokens=0.003,
@@ -65,7 +103,7 @@ def get_default_models() -> Dict[str, ModelConfig]:
         ),
         "gpt-4o-mini-openrouter": ModelConfig(
             name="openai/gpt-4o-mini",
-            provider="openrouter",
+            provider=_OPENROUTER,
             max_tokens=4000,
             temperature=0.1,
             cost_per_1k_tokens=0.00015,
@@ -73,7 +111,7 @@ def get_default_models() -> Dict[str, ModelConfig]:
         ),
         "deepseek-v3-openrouter": ModelConfig(
             name="deepseek/deepseek-chat",
-            provider="openrouter",
+            provider=_OPENROUTER,
             max_tokens=4000,
             temperature=0.1,
             cost_per_1k_tokens=0.00002,
@@ -82,7 +120,7 @@ def get_default_models() -> Dict[str, ModelConfig]:
         # Local Models (Ollama fallback)
         "llama2-7b": ModelConfig(
             name="llama2:7b",
-            provider="ollama",
+            provider=_OLLAMA,
             max_tokens=2000,
             temperature=0.1,
             cost_per_1k_tokens=0.0,  # Local inference
@@ -90,7 +128,7 @@ def get_default_models() -> Dict[str, ModelConfig]:
         ),
         "mistral-7b": ModelConfig(
             name="mistral:7b",
-            provider="ollama",
+            provider=_OLLAMA,
             max_tokens=2000,
             temperature=0.1,
             cost_per_1k_tokens=0.0,
@@ -99,12 +137,53 @@ def get_default_models() -> Dict[str, ModelConfig]:
     }
 
 
+# One assignment per line; comments and blank lines simply never match.
+# Values may be bare or wrapped in single or double quotes.
+_ENV_LINE_RE = re.compile(
+    rb"^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*="
+    rb"[ \t]*(?:\"([^\"\n]*)\"|'([^'\n]*)'|([^\n]*?))[ \t]*$",
+    re.M,
+)
+
+
+# Hashed membership beats the per-call tuple scan, and the set is built
+# once instead of per conversion.
+_TRUTHY = frozenset(("true", "1", "yes", "on"))
+
+
+def _to_bool(value: str) -> bool:
+    return value.lower() in _TRUTHY
+
+
+# Per-setting type converters; settings absent here stay strings.
+_CONVERTERS = {
+    "max_retries": int,
+    "timeout_seconds": int,
+    "cost_limit_per_day": float,
+    "enable_caching": _to_bool,
+    "log_api_calls": _to_bool,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_api_key(provider: str) -> Optional[str]:
+    """Memoized API-key lookup; cleared via LLMEnvironment.invalidate()."""
+    if provider == "openrouter":
+        return os.getenv("OPENROUTER_API_KEY")
+    return None
+
+
 class LLMEnvironment:
     """Manages environment variables and API keys for LLM providers."""
 
+    # Readiness probes call validate_setup repeatedly; env vars rarely
+    # change, so cached results stay valid for this long.
+    _VALIDATE_TTL_S = 30.0
+
     def __init__(self, config_file: Optional[Path] = None):
         self.config_file = config_file or Path(".env")
         self.settings = LLMSettings()
+        self._validate_cache: Optional[tuple] = None
         self._load_config()
 
     def _load_config(self):
@@ -120,46 +199,63 @@ class LLMEnvironment:
             "LLM_LOG_CALLS": "log_api_calls",
         }
 
+        # Read through one os.environ reference; each os.getenv call scans
+        # the environment block and allocates a fresh string.
+        env = os.environ
         for env_var, setting in env_mappings.items():
-            value = os.getenv(env_var)
+            value = env.get(env_var)
             if value is not None:
-                # Type conversion
-                if setting in ["max_retries", "timeout_seconds"]:
-                    value = int(value)
-                elif setting == "cost_limit_per_day":
-                    value = float(value)
-                elif setting in ["enable_caching", "log_api_calls"]:
-                    value = value.lower() in ("true", "1", "yes")
-
-                setattr(self.settings, setting, value)
-
-        # Load from config file if exists
-        if self.config_file.exists():
-            try:
-                with open(self.config_file) as f:
-                    for line in f:
-                        line = line.strip()
-                        if line and not line.startswith("#") and "=" in line:
-                            key, value = line.split("=", 1)
-                            key = key.strip()
-                            value = value.strip()
-                            # Remove quotes if present
-                            if value.startswith('"') and value.endswith('"'):
-                                value = value[1:-1]
-                            elif value.startswith("'") and value.endswith("'"):
-                                value = value[1:-1]
-                            os.environ[key] = value
-            except Exception as e:
-                print(f"Warning: Could not load config file {self.config_file}: {e}")
+                convert = _CONVERTERS.get(setting)
+                setattr(
+                    self.settings, setting, convert(value) if convert else value
+                )
+
+        # Load from config file if present; a single regex pass over the
+        # whole buffer replaces the per-line strip/split/quote handling.
+        # Reading directly folds the exists() stat into the open, and files
+        # without a single "=" skip the regex scan entirely.
+        try:
+            data = self.config_file.read_bytes()
+        except FileNotFoundError:
+            data = b""
+        except Exception as e:
+            logger.warning("Could not load config file %s: %s", self.config_file, e)
+            data = b""
+        if b"=" in data:
+            for match in _ENV_LINE_RE.finditer(data):
+                value = match.group(2) or match.group(3) or match.group(4) or b""
+                os.environ[match.group(1).decode()] = value.decode()
 
     def get_api_key(self, provider: str) -> Optional[str]:
-        """Get API key for specified provider."""
-        if provider == "openrouter":
-            return os.getenv("OPENROUTER_API_KEY")
-        return None
+        """Get API key for specified provider (memoized per provider)."""
+        return _cached_api_key(provider)
+
+    def invalidate(self):
+        """Drop memoized API-key lookups after environment changes."""
+        _cached_api_key.cache_clear()
+        self.invalidate_validation()
+
+    def invalidate_validation(self):
+        """Drop the cached validate_setup result."""
+        self._validate_cache = None
+
+    def reload(self):
+        """Drop memoized lookups and re-read environment and config file."""
+        self.invalidate()
+        self._load_config()
 
     def validate_setup(self) -> Dict[str, Any]:
-        """Validate LLM environment setup and return status."""
+        """Validate LLM environment setup and return status.
+
+        Results are cached for a short TTL so readiness probes do not
+        re-walk the model list on every call; invalidate_validation()
+        forces a fresh pass.
+        """
+        if self._validate_cache is not None:
+            cached_at, cached_status = self._validate_cache
+            if time.monotonic() - cached_at < self._VALIDATE_TTL_S:
+                return cached_status
+
         status = {
             "configured": True,
             "providers": {},
@@ -167,17 +263,12 @@ class LLMEnvironment:
             "recommendations": [],
         }
 
-        # Check API keys for configured providers
-        for model_name, model_config in self.settings.models.items():
-            provider = model_config.provider
-            if provider not in status["providers"]:
-                api_key = self.get_api_key(provider)
-                status["providers"][provider] = {
-                    "api_key_available": api_key is not None,
-                    "models": [],
-                }
-
-            status["providers"][provider]["models"].append(model_name)
+        # Check API keys once per provider using the precomputed index
+        for provider, model_names in self.settings._provider_index.items():
+            status["providers"][provider] = {
+                "api_key_available": self.get_api_key(provider) is not None,
+                "models": list(model_names),
+            }
 
         # Generate warnings and recommendations
         for provider, info in status["providers"].items():
@@ -193,6 +284,7 @@ class LLMEnvironment:
                 "Install Ollama for local inference: https://ollama.ai"
             )
 
+        self._validate_cache = (time.monotonic(), status)
         return status
 
     def save_config(self):
@@ -211,8 +303,15 @@ class LLMEnvironment:
             f"LLM_LOG_CALLS={self.settings.log_api_calls}",
         ]
 
-        with open(self.config_file, "w") as f:
-            f.write("\n".join(config_lines))
+        payload = "\n".join(config_lines).encode()
+        # Skip the write (and cache invalidation) when nothing changed.
+        try:
+            if self.config_file.read_bytes() == payload:
+                return
+        except OSError:
+            pass
+        self.config_file.write_bytes(payload)
+        self.invalidate_validation()
 
 
 # Global environment instance
@@ -227,9 +326,9 @@ def get_llm_environment() -> LLMEnvironment:
     return _env
 
 
-def setup_development_env():
-    """Quick setup for development with sensible defaults."""
-    env_content = """# LLM Configuration for Systematic Review Auditor
+# Example .env contents written by setup_development_env; a module
+# constant so the literal is built once at import.
+_DEV_ENV_TEMPLATE = """# LLM Configuration for Systematic Review Auditor
 # Copy to .env and add your API keys
 
 # OpenRouter Configuration (Primary and only provider)
@@ -252,11 +351,14 @@ LLM_LOG_CALLS=true
 # - Many other models from different providers
 """
 
+
+def setup_development_env():
+    """Quick setup for development with sensible defaults."""
     env_file = Path(".env.llm.example")
-    env_file.write_text(env_content)
-    print(f"Created example environment file: {env_file}")
-    print("Copy to .env and add your OpenRouter API key")
-    print("Get your OpenRouter API key at: https://openrouter.ai/keys")
+    env_file.write_text(_DEV_ENV_TEMPLATE)
+    logger.info("Created example environment file: %s", env_file)
+    logger.info("Copy to .env and add your OpenRouter API key")
+    logger.info("Get your OpenRouter API key at: https://openrouter.ai/keys")
 
 
 if __name__ == "__main__":
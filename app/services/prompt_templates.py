@@ -5,18 +5,39 @@ Contains specialized prompts for PICO extraction, PRISMA validation,
 risk of bias assessment, and other systematic review tasks.
 """
 
+import string
 from typing import Dict, List, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
+_FORMATTER = string.Formatter()
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class PromptTemplate:
     system_prompt: str
     user_template: str
+    # Format tokens parsed once at construction so format() joins
+    # precomputed segments instead of re-parsing the template each call.
+    _parsed: tuple = field(init=False, repr=False, compare=False, default=())
+
+    def __post_init__(self):
+        object.__setattr__(self, "_parsed", tuple(_FORMATTER.parse(self.user_template)))
 
     def format(self, **kwargs) -> str:
         """Format the user template with provided arguments."""
-        return self.user_template.format(**kwargs)
+        parts = []
+        for literal, field_name, spec, conversion in self._parsed:
+            if literal:
+                parts.append(literal)
+            if field_name is not None:
+                value = kwargs[field_name]
+                if conversion:
+                    value = _FORMATTER.convert_field(value, conversion)
+                if spec:
+                    parts.append(format(value, spec))
+                else:
+                    parts.append(value if isinstance(value, str) else str(value))
+        return "".join(parts)
 
 
 class SystemReviewPrompts:
@@ -113,6 +134,42 @@ Return JSON assessment:
 }}""",
     )
 
+    COMBINED_PICO_ROB = PromptTemplate(
+        system_prompt="""You are an expert systematic review methodologist covering two tasks in one pass:
+1. PICO extraction: identify Population, Intervention, Comparator and Outcomes exactly as stated in the manuscript text. Be conservative - only extract elements that are explicitly stated.
+2. Risk of bias: for each listed study, assess overall risk using RoB 2 for randomized trials and ROBINS-I for non-randomized studies, with domain-level judgments where the description supports them.
+
+Return structured JSON only.""",
+        user_template="""Analyze this systematic review in a single pass:
+
+Manuscript text:
+{manuscript_text}
+
+Included studies:
+{studies_text}
+
+Return a JSON object with this exact structure:
+{{
+  "pico": {{
+    "population": "specific population description or null",
+    "intervention": "intervention description or null",
+    "comparator": "comparator description or null",
+    "outcomes": ["outcome1", "outcome2"] or []
+  }},
+  "rob": {{
+    "<study_id>": {{
+      "overall_rob": "low|some_concerns|high",
+      "domains": {{
+        "domain_name": {{
+          "judgment": "low|some_concerns|high",
+          "rationale": "specific justification"
+        }}
+      }}
+    }}
+  }}
+}}""",
+    )
+
     GRADE_EVALUATION = PromptTemplate(
         system_prompt="""You are a GRADE methodology expert evaluating certainty of evidence. Assess evidence quality across five domains:
 1. Risk of bias
@@ -222,21 +279,24 @@ Provide interpretation:
     )
 
 
+# Name -> template lookup, built once at import instead of per call.
+_PROMPTS_MAP = {
+    "pico_extraction": SystemReviewPrompts.PICO_EXTRACTION,
+    "prisma_assessment": SystemReviewPrompts.PRISMA_ASSESSMENT,
+    "rob_assessment": SystemReviewPrompts.ROB_ASSESSMENT,
+    "combined_pico_rob": SystemReviewPrompts.COMBINED_PICO_ROB,
+    "grade_evaluation": SystemReviewPrompts.GRADE_EVALUATION,
+    "search_review": SystemReviewPrompts.SEARCH_STRATEGY_REVIEW,
+    "statistical_interpretation": SystemReviewPrompts.META_ANALYSIS_INTERPRETATION,
+    "meta_analysis_interpretation": SystemReviewPrompts.META_ANALYSIS_INTERPRETATION,
+}
+
+
 # Convenience function to get specific prompts
 def get_prompt(prompt_name: str) -> PromptTemplate:
     """Get a specific prompt template by name."""
-    prompts_map = {
-        "pico_extraction": SystemReviewPrompts.PICO_EXTRACTION,
-        "prisma_assessment": SystemReviewPrompts.PRISMA_ASSESSMENT,
-        "rob_assessment": SystemReviewPrompts.ROB_ASSESSMENT,
-        "grade_evaluation": SystemReviewPrompts.GRADE_EVALUATION,
-        "search_review": SystemReviewPrompts.SEARCH_STRATEGY_REVIEW,
-        "statistical_interpretation": SystemReviewPrompts.META_ANALYSIS_INTERPRETATION,
-        "meta_analysis_interpretation": SystemReviewPrompts.META_ANALYSIS_INTERPRETATION,
-    }
-
-    if prompt_name not in prompts_map:
-        available = ", ".join(prompts_map.keys())
+    try:
+        return _PROMPTS_MAP[prompt_name]
+    except KeyError:
+        available = ", ".join(_PROMPTS_MAP.keys())
         raise ValueError(f"Unknown prompt: {prompt_name}. Available: {available}")
-
-    return prompts_map[prompt_name]
@@ -14,6 +14,9 @@ Future:
 
 from typing import Dict, List, Optional, Any, Tuple
 from pathlib import Path
+import functools
+import io
+import os
 import re
 from collections import defaultdict
 
@@ -38,17 +41,97 @@ except ImportError:
 
 from app.models.schemas import Manuscript, PICO, SearchDescriptor, FlowCounts, StudyRecord, OutcomeEffect, ExclusionReason
 
+# All extraction patterns are compiled once at import; the per-call
+# re.findall(string, ...) form pays a cache lookup (and recompile on
+# eviction) for every document.
+_PICO_PATTERNS = {
+    'population': re.compile(r'(?:population|participants?|patients?)[:\s]+([^.]+)', re.IGNORECASE | re.MULTILINE),
+    'intervention': re.compile(r'(?:intervention|treatment|therapy)[:\s]+([^.]+)', re.IGNORECASE | re.MULTILINE),
+    'comparator': re.compile(r'(?:comparator?|control|comparison)[:\s]+([^.]+)', re.IGNORECASE | re.MULTILINE),
+    'outcomes': re.compile(r'(?:outcomes?|endpoints?)[:\s]+([^.]+)', re.IGNORECASE | re.MULTILINE),
+}
+_OUTCOME_SPLIT_RE = re.compile(r'[;,:]|\band\b')
+
+_DB_PATTERNS = {
+    'medline': re.compile(r'(?:medline|pubmed)', re.IGNORECASE),
+    'embase': re.compile(r'embase', re.IGNORECASE),
+    'central': re.compile(r'(?:central|cochrane)', re.IGNORECASE),
+    'cinahl': re.compile(r'cinahl', re.IGNORECASE),
+    'web of science': re.compile(r'web of science', re.IGNORECASE),
+    'psycinfo': re.compile(r'psycinfo', re.IGNORECASE),
+}
+_STRATEGY_SECTION_RE = re.compile(
+    r'(?:search strategy|database search|electronic search)[^.]*?([^.]{100,500})',
+    re.IGNORECASE | re.MULTILINE | re.DOTALL,
+)
+_DATE_RANGE_RE = re.compile(r'(\d{4})[^\d]*(\d{4})')
+_SEARCH_TERMS_RE = re.compile(r'(?:terms?|keywords?)[:\s]+([^.]{50,200})', re.IGNORECASE)
+
+_FLOW_PATTERNS = {
+    'identified': re.compile(r'(?:identified|records found)[^\d]*(\d+)', re.IGNORECASE),
+    'deduplicated': re.compile(r'(?:after.*?duplicates?.*?removed|deduplicated)[^\d]*(\d+)', re.IGNORECASE),
+    'screened': re.compile(r'(?:screened|title.*?abstract)[^\d]*(\d+)', re.IGNORECASE),
+    'fulltext': re.compile(r'(?:full.?text|retrieved)[^\d]*(\d+)', re.IGNORECASE),
+    'included': re.compile(r'(?:included|final)[^\d]*(\d+)', re.IGNORECASE),
+}
+_EXCLUSION_PATTERNS = [
+    re.compile(r'excluded[^\d]*(\d+)[^:]*:?\s*([^.\n]{10,100})', re.IGNORECASE),
+    re.compile(r'(\d+)[^:]*excluded[^:]*:?\s*([^.\n]{10,100})', re.IGNORECASE),
+]
+
+_INT_RE = re.compile(r'(\d+)')
+_NUMBER_RE = re.compile(r'([-+]?\d*\.?\d+)')
+_CI_RE = re.compile(r'([-+]?\d*\.?\d+)[,\s]+([-+]?\d*\.?\d+)')
+
+
+def _regex_only_ingest() -> bool:
+    """True when ingest should skip NLP enhancement entirely (default).
+
+    Pattern-based extraction covers most manuscripts; loading spaCy costs
+    around a second and the model's memory. Set SR_LAZY_SPACY=false to
+    re-enable NLP enhancement during ingest.
+    """
+    return os.getenv("SR_LAZY_SPACY", "true").lower() in ("true", "1", "yes")
+
+
+@functools.lru_cache(maxsize=1)
+def _load_spacy():
+    """Load the shared spaCy pipeline once across all extractor instances."""
+    if not NLP_AVAILABLE:
+        return None
+    try:
+        # Only doc.ents is consumed, so everything but tok2vec + ner is
+        # dead weight per token.
+        return spacy.load(
+            "en_core_web_sm",
+            disable=["tagger", "parser", "attribute_ruler", "lemmatizer"],
+        )
+    except OSError:
+        print("Warning: spaCy model 'en_core_web_sm' not found. Some NLP features disabled.")
+        return None
+
+
 class TextExtractor:
     """Common text processing utilities for both PDF and Word processors."""
-    
+
     def __init__(self):
-        self.nlp = None
-        if NLP_AVAILABLE:
-            try:
-                self.nlp = spacy.load("en_core_web_sm")
-            except OSError:
-                print("Warning: spaCy model 'en_core_web_sm' not found. Some NLP features disabled.")
-    
+        # spaCy loads lazily on first nlp access; construction stays cheap
+        # for regex-only ingest.
+        self._nlp = None
+        self._nlp_loaded = False
+
+    @property
+    def nlp(self):
+        if not self._nlp_loaded:
+            self._nlp = _load_spacy()
+            self._nlp_loaded = True
+        return self._nlp
+
+    @nlp.setter
+    def nlp(self, value):
+        self._nlp = value
+        self._nlp_loaded = True
+
     def extract_pico_elements(self, text: str) -> Optional[PICO]:
         """Extract PICO elements from manuscript text using pattern matching and NLP."""
         
@@ -62,26 +145,19 @@ class TextExtractor:
         }
         
         # Look for explicit PICO sections
-        pico_patterns = {
-            'population': r'(?:population|participants?|patients?)[:\s]+([^.]+)',
-            'intervention': r'(?:intervention|treatment|therapy)[:\s]+([^.]+)', 
-            'comparator': r'(?:comparator?|control|comparison)[:\s]+([^.]+)',
-            'outcomes': r'(?:outcomes?|endpoints?)[:\s]+([^.]+)'
-        }
-        
-        for element, pattern in pico_patterns.items():
-            matches = re.findall(pattern, text, re.IGNORECASE | re.MULTILINE)
+        for element, pattern in _PICO_PATTERNS.items():
+            matches = pattern.findall(text)
             if matches:
                 if element == 'outcomes':
                     # Split outcomes by common delimiters
                     outcomes_text = matches[0]
-                    outcomes = [o.strip() for o in re.split(r'[;,:]|\band\b', outcomes_text) if o.strip()]
+                    outcomes = [o.strip() for o in _OUTCOME_SPLIT_RE.split(outcomes_text) if o.strip()]
                     pico_data['outcomes'] = outcomes[:5]  # Limit to first 5
                 else:
                     pico_data[element] = matches[0].strip()
         
-        # Enhanced extraction using NLP if available
-        if self.nlp and any(pico_data.values()):
+        # Enhanced extraction using NLP if enabled and available
+        if not _regex_only_ingest() and self.nlp and any(pico_data.values()):
             pico_data = self._enhance_pico_with_nlp(text, pico_data)
         
         # Only return PICO if we found substantial content
@@ -93,13 +169,32 @@ class TextExtractor:
     def _enhance_pico_with_nlp(self, text: str, pico_data: Dict[str, Any]) -> Dict[str, Any]:
         """Use NLP to enhance PICO extraction."""
         doc = self.nlp(text[:10000])  # Limit text length for processing
-        
+        return self._apply_entities(doc, pico_data)
+
+    def enhance_pico_batch(self, items: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Enhance several (text, pico_data) pairs in one nlp.pipe pass.
+
+        Batching amortizes the model's per-call setup across documents;
+        multi-manuscript ingest should prefer this over calling
+        _enhance_pico_with_nlp in a loop.
+        """
+        if not self.nlp:
+            return [pico_data for _, pico_data in items]
+        docs = self.nlp.pipe((text[:10000] for text, _ in items), batch_size=32)
+        return [
+            self._apply_entities(doc, pico_data)
+            for doc, (_, pico_data) in zip(docs, items)
+        ]
+
+    @staticmethod
+    def _apply_entities(doc, pico_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Fold a parsed doc's entities into partially extracted PICO data."""
         # Extract medical entities
         medical_entities = []
         for ent in doc.ents:
             if ent.label_ in ["PERSON", "ORG", "PRODUCT", "EVENT", "DISEASE"]:
                 medical_entities.append(ent.text)
-        
+
         # If population is missing, look for demographic mentions
         if not pico_data['population'] and medical_entities:
             population_candidates = [ent for ent in medical_entities if any(
@@ -107,38 +202,25 @@ class TextExtractor:
             )]
             if population_candidates:
                 pico_data['population'] = population_candidates[0]
-        
+
         return pico_data
     
     def parse_search_strategies(self, text: str) -> List[SearchDescriptor]:
         """Parse search strategy sections to extract database searches.""" 
         strategies = []
-        
-        # Common database patterns
-        db_patterns = {
-            'medline': r'(?:medline|pubmed)',
-            'embase': r'embase',
-            'central': r'(?:central|cochrane)',
-            'cinahl': r'cinahl',
-            'web of science': r'web of science',
-            'psycinfo': r'psycinfo'
-        }
-        
+
         # Look for search strategy sections
-        strategy_sections = re.findall(
-            r'(?:search strategy|database search|electronic search)[^.]*?([^.]{100,500})',
-            text, re.IGNORECASE | re.MULTILINE | re.DOTALL
-        )
-        
+        strategy_sections = _STRATEGY_SECTION_RE.findall(text)
+
         for section in strategy_sections:
-            for db_name, pattern in db_patterns.items():
-                if re.search(pattern, section, re.IGNORECASE):
+            for db_name, pattern in _DB_PATTERNS.items():
+                if pattern.search(section):
                     # Extract date ranges
-                    date_match = re.search(r'(\d{4})[^\d]*(\d{4})', section)
+                    date_match = _DATE_RANGE_RE.search(section)
                     dates = f"{date_match.group(1)}–{date_match.group(2)}" if date_match else None
-                    
+
                     # Extract search terms (simplified)
-                    terms_match = re.search(r'(?:terms?|keywords?)[:\s]+([^.]{50,200})', section, re.IGNORECASE)
+                    terms_match = _SEARCH_TERMS_RE.search(section)
                     strategy = terms_match.group(1).strip() if terms_match else f"Database search for {db_name}"
                     
                     strategies.append(SearchDescriptor(
@@ -153,18 +235,9 @@ class TextExtractor:
     def extract_flow_diagram(self, text: str) -> Optional[FlowCounts]:
         """Extract PRISMA flow diagram numbers using pattern matching."""
         
-        # Common flow diagram patterns
-        flow_patterns = {
-            'identified': r'(?:identified|records found)[^\d]*(\d+)',
-            'deduplicated': r'(?:after.*?duplicates?.*?removed|deduplicated)[^\d]*(\d+)',
-            'screened': r'(?:screened|title.*?abstract)[^\d]*(\d+)',
-            'fulltext': r'(?:full.?text|retrieved)[^\d]*(\d+)',
-            'included': r'(?:included|final)[^\d]*(\d+)',
-        }
-        
         flow_data = {}
-        for field, pattern in flow_patterns.items():
-            matches = re.findall(pattern, text, re.IGNORECASE)
+        for field, pattern in _FLOW_PATTERNS.items():
+            matches = pattern.findall(text)
             if matches:
                 try:
                     flow_data[field] = int(matches[0])
@@ -173,13 +246,8 @@ class TextExtractor:
         
         # Extract exclusion reasons
         excluded = []
-        exclusion_patterns = [
-            r'excluded[^\d]*(\d+)[^:]*:?\s*([^.\n]{10,100})',
-            r'(\d+)[^:]*excluded[^:]*:?\s*([^.\n]{10,100})'
-        ]
-        
-        for pattern in exclusion_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+        for pattern in _EXCLUSION_PATTERNS:
+            matches = pattern.findall(text)
             for match in matches:
                 try:
                     n = int(match[0])
@@ -196,11 +264,18 @@ class TextExtractor:
         
         return None
 
+@functools.lru_cache(maxsize=1)
+def _get_text_extractor() -> TextExtractor:
+    """Shared TextExtractor: it is stateless apart from the lazily loaded
+    spaCy pipeline, so every processor instance can reuse one."""
+    return TextExtractor()
+
+
 class PDFProcessor:
     """Handles extraction of systematic review content from PDF documents."""
-    
+
     def __init__(self):
-        self.text_extractor = TextExtractor()
+        self.text_extractor = _get_text_extractor()
     
     def extract_manuscript(self, pdf_path: Path) -> Optional[Manuscript]:
         """
@@ -219,28 +294,50 @@ class PDFProcessor:
 
 class WordProcessor:
     """Handles extraction from Word documents (.docx)."""
-    
+
     def __init__(self):
-        self.text_extractor = TextExtractor()
+        self.text_extractor = _get_text_extractor()
     
     def extract_manuscript(self, docx_path: Path) -> Optional[Manuscript]:
-        """Extract manuscript data from Word document."""
+        """Extract manuscript data from Word document on disk."""
+        return self._extract(docx_path, docx_path.stem)
+
+    def extract_manuscript_from_buffer(self, buffer, stem: str) -> Optional[Manuscript]:
+        """Extract manuscript data from an in-memory file-like object."""
+        return self._extract(buffer, stem)
+
+    def _extract(self, source, stem: str) -> Optional[Manuscript]:
+        """Shared extraction from a path or file-like source."""
         if not DOCX_AVAILABLE:
             print("python-docx not available. Install with: pip install python-docx")
             return None
         
         try:
-            doc = Document(docx_path)
-            
-            # Extract all text content
-            full_text = self._extract_full_text(doc)
-            
-            # Extract structured components
-            manuscript_id = f"docx-{docx_path.stem}"
+            doc = Document(source)
+
+            # Split text into heading-delimited sections so each extractor
+            # scans only its likely sections instead of the whole document.
+            sections = list(self._iter_sections(doc))
+            full_text = "\n".join(block for _, block in sections)
+
+            pico_text = self._section_text(sections, self._PICO_SECTIONS) or full_text
+            search_text = self._section_text(sections, self._SEARCH_SECTIONS) or full_text
+            flow_text = self._section_text(sections, self._FLOW_SECTIONS) or full_text
+
+            # Extract structured components; if a targeted scan comes up
+            # empty, retry against the full text so sectioning never loses
+            # content that the old whole-document pass would have found.
+            manuscript_id = f"docx-{stem}"
             title = self._extract_title(doc)
-            pico = self.text_extractor.extract_pico_elements(full_text)
-            search_strategies = self.text_extractor.parse_search_strategies(full_text)
-            flow = self.text_extractor.extract_flow_diagram(full_text)
+            pico = self.text_extractor.extract_pico_elements(pico_text)
+            if pico is None and pico_text is not full_text:
+                pico = self.text_extractor.extract_pico_elements(full_text)
+            search_strategies = self.text_extractor.parse_search_strategies(search_text)
+            if not search_strategies and search_text is not full_text:
+                search_strategies = self.text_extractor.parse_search_strategies(full_text)
+            flow = self.text_extractor.extract_flow_diagram(flow_text)
+            if flow is None and flow_text is not full_text:
+                flow = self.text_extractor.extract_flow_diagram(full_text)
             studies = self._extract_studies_from_tables(doc)
             
             return Manuscript(
@@ -253,26 +350,54 @@ class WordProcessor:
             )
             
         except Exception as e:
-            print(f"Error processing Word document {docx_path}: {e}")
+            print(f"Error processing Word document {stem}: {e}")
             return None
     
-    def _extract_full_text(self, doc: DocxDocument) -> str:
-        """Extract all text content from Word document."""
-        text_parts = []
-        
-        # Extract from paragraphs
+    # Section-name keywords routing each extractor to its likely sections.
+    _PICO_SECTIONS = ("abstract", "method", "introduction", "background")
+    _SEARCH_SECTIONS = ("search", "method")
+    _FLOW_SECTIONS = ("result", "selection", "screening", "flow", "method")
+
+    def _iter_sections(self, doc: DocxDocument):
+        """Yield (section_name, text_block) pairs split on Heading styles.
+
+        Documents without heading styles come through as one "body" block
+        (plus a "tables" block), matching the old whole-document text.
+        """
+        section = "body"
+        parts = []
         for paragraph in doc.paragraphs:
-            if paragraph.text.strip():
-                text_parts.append(paragraph.text)
-        
-        # Extract from tables
+            text = paragraph.text.strip()
+            if not text:
+                continue
+            style_name = getattr(paragraph.style, "name", "") or ""
+            if style_name.startswith("Heading"):
+                if parts:
+                    yield section, "\n".join(parts)
+                section = text.lower()
+                parts = [paragraph.text]
+            else:
+                parts.append(paragraph.text)
+        if parts:
+            yield section, "\n".join(parts)
+
+        table_parts = []
         for table in doc.tables:
             for row in table.rows:
                 row_text = " ".join(cell.text.strip() for cell in row.cells if cell.text.strip())
                 if row_text:
-                    text_parts.append(row_text)
-        
-        return "\n".join(text_parts)
+                    table_parts.append(row_text)
+        if table_parts:
+            yield "tables", "\n".join(table_parts)
+
+    @staticmethod
+    def _section_text(sections, keywords) -> str:
+        """Join the blocks whose section name mentions any keyword."""
+        return "\n".join(
+            block
+            for name, block in sections
+            if any(keyword in name for keyword in keywords)
+        )
     
     def _extract_title(self, doc: DocxDocument) -> Optional[str]:
         """Extract document title from first paragraph or heading."""
@@ -340,7 +465,7 @@ class WordProcessor:
                 n_total = None
                 if 'n' in col_mapping:
                     n_text = row.cells[col_mapping['n']].text.strip()
-                    n_match = re.search(r'(\d+)', n_text)
+                    n_match = _INT_RE.search(n_text)
                     if n_match:
                         n_total = int(n_match.group(1))
                 
@@ -386,7 +511,7 @@ class WordProcessor:
                 
                 # Extract effect size
                 effect_text = row.cells[col_mapping.get('effect', 2)].text.strip()
-                effect_match = re.search(r'([-+]?\d*\.?\d+)', effect_text)
+                effect_match = _NUMBER_RE.search(effect_text)
                 if not effect_match:
                     continue
                 effect = float(effect_match.group(1))
@@ -396,14 +521,14 @@ class WordProcessor:
                 variance = 0.05  # Default variance
                 
                 # Try to parse confidence interval
-                ci_match = re.search(r'([-+]?\d*\.?\d+)[,\s]+([-+]?\d*\.?\d+)', var_text)
+                ci_match = _CI_RE.search(var_text)
                 if ci_match:
                     ci_low, ci_high = float(ci_match.group(1)), float(ci_match.group(2))
                     se = (ci_high - ci_low) / (2 * 1.96)  # Approximate SE from 95% CI
                     variance = se ** 2
                 else:
-                    # Try to parse SE directly  
-                    se_match = re.search(r'([-+]?\d*\.?\d+)', var_text)
+                    # Try to parse SE directly
+                    se_match = _NUMBER_RE.search(var_text)
                     if se_match:
                         se = float(se_match.group(1))
                         variance = se ** 2
@@ -445,3 +570,17 @@ def extract_manuscript_from_file(file_path: Path) -> Optional[Manuscript]:
     """Extract manuscript from file using appropriate processor."""
     processor = create_processor(file_path)
     return processor.extract_manuscript(file_path)
+
+def extract_manuscript_from_buffer(buffer, filename: str) -> Optional[Manuscript]:
+    """Extract manuscript from an open binary buffer without copying it."""
+    path = Path(filename)
+    suffix = path.suffix.lower()
+    if suffix not in ['.docx', '.doc']:
+        raise ValueError(f"Unsupported file type: {suffix}")
+    processor = WordProcessor()
+    return processor.extract_manuscript_from_buffer(buffer, path.stem)
+
+
+def extract_manuscript_from_bytes(data: bytes, filename: str) -> Optional[Manuscript]:
+    """Extract manuscript from in-memory upload bytes, skipping the temp-file round trip."""
+    return extract_manuscript_from_buffer(io.BytesIO(data), filename)
@@ -80,6 +80,23 @@ class TestDocxUpload:
         # Should handle gracefully - either 422 or 500 with appropriate error
         assert response.status_code in [422, 500]
 
+    def test_large_upload_spilled_and_temp_file_removed(self, tmp_path, monkeypatch):
+        """Test that rolled (large) uploads are staged to disk and cleaned up."""
+        from app import main as app_main
+
+        monkeypatch.setattr(app_main, "_UPLOAD_TMPDIR", str(tmp_path))
+        # Over Starlette's 1 MiB spool limit, so the upload rolls to disk
+        # and takes the temp-file staging path instead of the in-memory one.
+        payload = b"PK\x03\x04" + b"\x00" * (2 * 1024 * 1024)
+        files = {"file": ("big.docx", io.BytesIO(payload), "application/vnd.openxmlformats-officedocument.wordprocessingml.document")}
+
+        response = client.post("/review/parse", files=files)
+
+        # Not a real DOCX, so extraction fails - but the staging path ran
+        assert response.status_code in [422, 500]
+        # The spilled temp file must be unlinked once the request finishes
+        assert list(tmp_path.iterdir()) == []
+
     def test_upload_corrupted_docx(self):
         """Test upload with corrupted DOCX file."""
         # Create fake DOCX content (just random bytes)
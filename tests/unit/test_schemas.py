@@ -0,0 +1,20 @@
+"""Unit tests for response schema contracts."""
+
+from app.models.schemas import ReviewResult
+
+
+def test_review_result_schema_shape():
+    """Pin the ReviewResult payload shape served by the review endpoints.
+
+    The endpoints serialize ReviewResult directly (no response_model
+    re-validation), so this schema check is what guards the wire contract.
+    """
+    schema = ReviewResult.model_json_schema()
+    assert set(schema["properties"]) == {
+        "issues",
+        "meta",
+        "extraction_info",
+        "analysis_metadata",
+        "manuscript",
+    }
+    assert set(schema["required"]) == {"issues", "meta"}
@@ -0,0 +1,61 @@
+"""Unit tests for the async streaming helpers in app.main.
+
+The SSE endpoints rely on these helpers to drive the synchronous
+orchestrator generator without blocking the event loop and to merge
+orchestrator events with log lines.
+"""
+
+import asyncio
+
+from app.main import (
+    _LOG_BATCH_MAX,
+    _drain_log_burst,
+    _iterate_in_thread,
+    _merge_events_and_logs,
+)
+
+
+def test_iterate_in_thread_preserves_order():
+    def gen():
+        yield from range(5)
+
+    async def collect():
+        return [item async for item in _iterate_in_thread(gen())]
+
+    assert asyncio.run(collect()) == [0, 1, 2, 3, 4]
+
+
+def test_merge_events_and_logs_forwards_both_sources():
+    def events():
+        yield "e1"
+        yield "e2"
+
+    async def run():
+        log_queue = asyncio.Queue()
+        log_queue.put_nowait("l1")
+        log_queue.put_nowait("l2")
+        pairs = []
+        async for kind, payload in _merge_events_and_logs(
+            _iterate_in_thread(events()), log_queue
+        ):
+            pairs.append((kind, payload))
+        return pairs
+
+    pairs = asyncio.run(run())
+    events_seen = [p for k, p in pairs if k == "event"]
+    log_lines = [line for k, p in pairs if k == "log" for line in p]
+    assert events_seen == ["e1", "e2"]
+    assert log_lines == ["l1", "l2"]
+
+
+def test_drain_log_burst_caps_batch_size():
+    async def run():
+        q = asyncio.Queue()
+        for i in range(_LOG_BATCH_MAX + 5):
+            q.put_nowait(f"line-{i}")
+        batch = _drain_log_burst(q, [])
+        return batch, q.qsize()
+
+    batch, remaining = asyncio.run(run())
+    assert len(batch) == _LOG_BATCH_MAX
+    assert remaining == 5